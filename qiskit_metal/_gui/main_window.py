@@ -19,9 +19,9 @@ import os
 from pathlib import Path
 from typing import List, TYPE_CHECKING
 
-from PySide2.QtCore import QTimer, Qt
+from PySide2.QtCore import QCoreApplication, QEvent, QTimer, Qt
 from PySide2.QtGui import QIcon, QPixmap
-from PySide2.QtWidgets import QDialog, QDockWidget, QFileDialog, QLabel, QMainWindow, QMessageBox, QVBoxLayout
+from PySide2.QtWidgets import QDialog, QFileDialog, QLabel, QMessageBox, QVBoxLayout
 
 from qiskit_metal._gui.widgets.qlibrary_display.delegate_qlibrary import LibraryDelegate
 from qiskit_metal._gui.widgets.qlibrary_display.file_model_qlibrary import QFileSystemLibraryModel
@@ -29,14 +29,9 @@ from qiskit_metal._gui.widgets.qlibrary_display.proxy_model_qlibrary import Libr
 from .elements_window import ElementsWindow
 from .main_window_base import QMainWindowBaseHandler, QMainWindowExtensionBase, kick_start_qApp
 from .main_window_ui import Ui_MainWindow
-from .renderer_gds_gui import RendererGDSWidget
-from .renderer_hfss_gui import RendererHFSSWidget
-from .renderer_q3d_gui import RendererQ3DWidget
 from .utility._handle_qt_messages import slot_catch_error
 from .widgets.all_components.table_model_all_components import \
     QTableModel_AllComponents
-from .widgets.build_history.build_history_scroll_area import BuildHistoryScrollArea
-from .widgets.create_component_window import parameter_entry_window as pew
 from .widgets.edit_component.component_widget import ComponentWidget
 from .widgets.plot_widget.plot_window import QMainWindowPlot
 from .widgets.variable_table import PropertyTableWidget
@@ -46,8 +41,34 @@ from ..designs.design_base import QDesign
 if not config.is_building_docs():
     pass
 
+# Absolute path and package name of the QLibrary, shown in the library dock
+_QLIBRARY_ROOT = os.path.dirname(os.path.abspath(qlibrary.__file__))
+_QLIBRARY_FOLDERNAME = qlibrary.__name__
+
 if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from PySide2.QtWidgets import QDockWidget, QMainWindow
     from ..renderers.renderer_mpl.mpl_canvas import PlotCanvas
+    from .renderer_gds_gui import RendererGDSWidget
+    from .renderer_hfss_gui import RendererHFSSWidget
+    from .renderer_q3d_gui import RendererQ3DWidget
+
+# Custom event type used to re-enter the GUI from the Qt event loop.
+# Posting an event is cheaper than a signal/timer round trip.
+REFRESH_EVENT = QEvent.Type(QEvent.registerEventType())
+
+
+class RefreshEvent(QEvent):
+    """Event that calls `fn` when it is processed by the main window.
+
+    Args:
+        fn (callable): Function to call, without arguments.
+    """
+
+    def __init__(self, fn, key=None):
+        super().__init__(REFRESH_EVENT)
+        self.fn = fn
+        self.key = key
 
 
 class QMainWindowExtension(QMainWindowExtensionBase):
@@ -65,9 +86,14 @@ class QMainWindowExtension(QMainWindowExtensionBase):
 
     def __init__(self):
         super().__init__()
-        self.gds_gui = None  # type: RendererGDSWidget
-        self.hfss_gui = None  # type: RendererHFSSWidget
-        self.q3d_gui = None  # type: RendererQ3DWidget
+        self.gds_gui: 'RendererGDSWidget' = None
+        self.hfss_gui: 'RendererHFSSWidget' = None
+        self.q3d_gui: 'RendererQ3DWidget' = None
+        # RefreshEvents still in the Qt queue, by compaction key
+        self._pending_events = dict()
+        # Dialogs, created on first use and reused afterwards
+        self._save_dialog = None  # type: QFileDialog
+        self._delete_all_dialog = None  # type: QMessageBox
 
     @property
     def design(self) -> 'QDesign':
@@ -83,6 +109,54 @@ class QMainWindowExtension(QMainWindowExtensionBase):
         """Returns the MetalGUI."""
         return self.handler
 
+    def event(self, event: QEvent) -> bool:
+        """Handle our `RefreshEvent`, defer all other events to Qt.
+
+        Args:
+            event (QEvent): The event to process
+
+        Returns:
+            bool: True if the event was recognized and processed
+        """
+        if event.type() == REFRESH_EVENT:
+            self._pending_events.pop(event.key, None)
+            self._call_posted(event.fn)
+            return True
+        return super().event(event)
+
+    @slot_catch_error()
+    def _call_posted(self, fn):
+        """Call a function posted with `post_call`.
+
+        Exceptions are logged, as in any other slot, rather than raised into
+        the Qt event dispatch.
+
+        Args:
+            fn (callable): Function to call, without arguments.
+        """
+        fn()
+
+    def post_call(self, fn, key=None):
+        """Post a `RefreshEvent` so that `fn` is called from the event loop.
+
+        Events are compacted by `key`: if an event with the same key is
+        still waiting in the queue, it is updated to call `fn` instead of
+        posting a new one. Thus, a burst of identical requests results in
+        a single call.
+
+        Args:
+            fn (callable): Function to call, without arguments.
+            key (hashable): Compaction key.  Defaults to None -- use `fn`.
+        """
+        key = fn if key is None else key
+        pending = self._pending_events.get(key)
+        if pending is not None:
+            pending.fn = fn
+            return
+        event = RefreshEvent(fn, key)
+        self._pending_events[key] = event
+        QCoreApplication.postEvent(self, event)
+
     def _set_element_tab(self, yesno: bool):
         """Set which part of the element table is in use.
 
@@ -99,26 +173,63 @@ class QMainWindowExtension(QMainWindowExtensionBase):
 
     def show_renderer_gds(self):
         """Handles click on GDS Renderer action."""
-        self.gds_gui = RendererGDSWidget(self, self.gui)
+        # Imported on first use, to keep the renderers off the startup path
+        from . import renderer_gds_gui
+        self.gds_gui = renderer_gds_gui.RendererGDSWidget(self, self.gui)
         self.gds_gui.show()
 
     def show_renderer_hfss(self):
         """Handles click on HFSS Renderer action."""
-        self.hfss_gui = RendererHFSSWidget(self, self.gui)
+        from . import renderer_hfss_gui
+        self.hfss_gui = renderer_hfss_gui.RendererHFSSWidget(self, self.gui)
         self.hfss_gui.show()
 
     def show_renderer_q3d(self):
         """Handles click on Q3D Renderer action."""
-        self.q3d_gui = RendererQ3DWidget(self, self.gui)
+        from . import renderer_q3d_gui
+        self.q3d_gui = renderer_q3d_gui.RendererQ3DWidget(self, self.gui)
         self.q3d_gui.show()
 
+    def _get_save_dialog(self) -> QFileDialog:
+        """Get the dialog used to choose where to save a design.
+
+        The dialog is created once and reused, which makes opening it again
+        much faster.
+
+        Returns:
+            QFileDialog: The save dialog
+        """
+        if self._save_dialog is None:
+            dialog = QFileDialog(
+                self, 'Select a new location to save Metal design to')
+            dialog.setAcceptMode(QFileDialog.AcceptSave)
+            dialog.setFileMode(QFileDialog.AnyFile)
+            dialog.setNameFilter('*.metal.py')
+            dialog.setOptions(QFileDialog.DontUseNativeDialog |
+                              QFileDialog.DontResolveSymlinks)
+            self._save_dialog = dialog
+        return self._save_dialog
+
+    def _get_save_filename(self) -> str:
+        """Ask the user where to save the design.
+
+        Returns:
+            str: The chosen file path, or an empty string if cancelled
+        """
+        dialog = self._get_save_dialog()
+        dialog.selectFile(self.design.get_design_name() + '.metal.py')
+        if dialog.exec_() == QDialog.Accepted:
+            return dialog.selectedFiles()[0]
+        return ''
+
     def delete_all_components(self):
         """Delete all components."""
-        ret = QMessageBox.question(
-            self,
-            'Delete all components?',
-            "Are you sure you want to clear all Metal components?",
-            buttons=(QMessageBox.Yes | QMessageBox.No))
+        if self._delete_all_dialog is None:
+            self._delete_all_dialog = QMessageBox(
+                QMessageBox.Question, 'Delete all components?',
+                "Are you sure you want to clear all Metal components?",
+                QMessageBox.Yes | QMessageBox.No, self)
+        ret = self._delete_all_dialog.exec_()
         if ret == QMessageBox.Yes:
             self.logger.info('Delete all components.')
             self.design.delete_all_components()
@@ -129,11 +240,9 @@ class QMainWindowExtension(QMainWindowExtensionBase):
     @slot_catch_error()
     def save_design_copy(self):
         """Saves a separate copy of design under a different name"""
-        filename = QFileDialog.getSaveFileName(
-            None,
-            'Select a new location to save Metal design to',
-            self.design.get_design_name() + '.metal.py',
-            selectedFilter='*.metal.py')[0]
+        filename = self._get_save_filename()
+        if not filename:
+            return
 
         # save python script to file path
         pyscript = self.design.to_python_script()
@@ -152,11 +261,9 @@ class QMainWindowExtension(QMainWindowExtensionBase):
                     'that needs to be copied into a jupyter notebook to run.'
                     'The "Load" button has not yet been implemented.')
 
-                filename = QFileDialog.getSaveFileName(
-                    None,
-                    'Select a new location to save Metal design to',
-                    self.design.get_design_name() + '.metal.py',
-                    selectedFilter='*.metal.py')[0]
+                filename = self._get_save_filename()
+                if not filename:
+                    return
                 self.design.save_path = filename
             # save python script to file path
             pyscript = self.design.to_python_script()
@@ -187,7 +294,7 @@ class QMainWindowExtension(QMainWindowExtensionBase):
         """Handles click on Refresh."""
         self.logger.info(
             f'Force refresh of all widgets (does not rebuild components)...')
-        self.gui.refresh()
+        self.post_call(self.gui.refresh, key='refresh')
 
     @slot_catch_error()
     def rebuild(self, _=None):
@@ -195,7 +302,7 @@ class QMainWindowExtension(QMainWindowExtensionBase):
         self.logger.info(
             f'Rebuilding all components in the model (and refreshing widgets)...'
         )
-        self.gui.rebuild()
+        self.post_call(self.gui.rebuild, key='rebuild')
 
     @slot_catch_error()
     def create_build_log_window(self, _=None):
@@ -247,6 +354,45 @@ class QMainWindowExtension(QMainWindowExtensionBase):
         return True
 
 
+class _RefreshGuard():
+    """Context manager that batches the refreshes of a `MetalGUI`.
+
+    While the guard is active, calls to `refresh`, `refresh_design` and
+    `refresh_plot` only mark the corresponding parts of the GUI as dirty
+    and widget repaints are suspended. On exit of the outermost guard,
+    the dirty parts are refreshed once and a single repaint is issued.
+
+    Args:
+        gui (MetalGUI): The GUI whose refreshes should be batched.
+    """
+
+    def __init__(self, gui: 'MetalGUI'):
+        self.gui = gui
+        self._outermost = False
+
+    def _widgets(self):
+        """The widgets whose updates are suspended by the guard."""
+        return (self.gui.plot_win, self.gui.ui.tableComponents,
+                self.gui.main_window)
+
+    def __enter__(self):
+        self._outermost = not self.gui._refresh_suppressed
+        if self._outermost:
+            self.gui._refresh_suppressed = True
+            for widget in self._widgets():
+                widget.setUpdatesEnabled(False)
+        return self.gui
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._outermost:
+            self.gui._refresh_suppressed = False
+            for widget in self._widgets():
+                widget.setUpdatesEnabled(True)
+            self.gui._flush_refresh()
+            self.gui.main_window.update()
+        return False
+
+
 class MetalGUI(QMainWindowBaseHandler):
     """Qiskit Metal Main GUI.
 
@@ -270,6 +416,15 @@ class MetalGUI(QMainWindowBaseHandler):
         'dockLibrary', 'dockVariables'
     ]
 
+    _RefreshGuard = _RefreshGuard
+
+    # Widgets enabled only when there is a design, see
+    # `_set_enabled_design_widgets`. Names of attributes of self.ui and self.
+    _design_widgets_ui = ('actionSave', 'action_full_refresh', 'actionRebuild',
+                          'actionDelete_All', 'dockComponent', 'dockLibrary',
+                          'dockDesign', 'dockConnectors')
+    _design_widgets_self = ('component_window', 'elements_win')
+
     def __init__(self, design: QDesign = None):
         """
         Args:
@@ -284,6 +439,15 @@ class MetalGUI(QMainWindowBaseHandler):
         if not self.qApp:
             logging.error("Could not start Qt event loop using QApplication.")
 
+        # Last window title set by `update_design_name`
+        self._last_title = None  # type: str
+
+        # Refresh batching, see `_RefreshGuard`
+        self._refresh_suppressed = False
+        self._dirty_design = False
+        self._dirty_table = False
+        self._dirty_plot = False
+
         super().__init__()
 
         # use set_design
@@ -333,24 +497,28 @@ class MetalGUI(QMainWindowBaseHandler):
             enabled (bool): True to enable, False to disable the design widgets.  Defaults to True.
         """
 
+        _missing = object()
+
         def setEnabled(parent, widgets):
             for widgetname in widgets:
-                if hasattr(parent, widgetname):
-                    widget = getattr(parent, widgetname)  # type: QWidget
-                    if widget:
-                        widget.setEnabled(enabled)
-                else:
+                widget = getattr(parent, widgetname, _missing)  # type: QWidget
+                if widget is _missing:
                     self.logger.error(f'GUI issue: wrong name: {widgetname}')
-
-        widgets = [
-            'actionSave', 'action_full_refresh', 'actionRebuild',
-            'actionDelete_All', 'dockComponent', 'dockLibrary', 'dockDesign',
-            'dockConnectors'
-        ]
-        setEnabled(self.ui, widgets)
-
-        widgets = ['component_window', 'elements_win']
-        setEnabled(self, widgets)
+                elif widget:
+                    widget.setEnabled(enabled)
+
+        # Suspend repaints so that Qt repaints once for all the widgets,
+        # unless they are already suspended, e.g., by a `_RefreshGuard`
+        suspend = self.main_window.updatesEnabled()
+        if suspend:
+            self.main_window.setUpdatesEnabled(False)
+        try:
+            setEnabled(self.ui, self._design_widgets_ui)
+            setEnabled(self, self._design_widgets_self)
+        finally:
+            if suspend:
+                self.main_window.setUpdatesEnabled(True)
+                self.main_window.update()
 
     def set_design(self, design: QDesign):
         """Core function to set a new design.
@@ -360,25 +528,31 @@ class MetalGUI(QMainWindowBaseHandler):
                 The design contains all components and elements
         """
         self.design = design
+        self._last_title = None
+
+        # The QLibrary models do not depend on the design. They are built
+        # once in `_setup_library_widget`, from __init__, and must not be
+        # rebuilt here.
 
-        self._set_enabled_design_widgets(True)
+        with self._RefreshGuard(self):
+            self._set_enabled_design_widgets(True)
 
-        self.plot_win.set_design(design)
-        self.elements_win.force_refresh()
+            self.plot_win.set_design(design)
+            self.elements_win.force_refresh()
 
-        if self.main_window.gds_gui:
-            self.main_window.gds_gui.set_design(design)
+            if self.main_window.gds_gui:
+                self.main_window.gds_gui.set_design(design)
 
-        if self.main_window.hfss_gui:
-            self.main_window.hfss_gui.set_design(design)
+            if self.main_window.hfss_gui:
+                self.main_window.hfss_gui.set_design(design)
 
-        if self.main_window.q3d_gui:
-            self.main_window.q3d_gui.set_design(design)
+            if self.main_window.q3d_gui:
+                self.main_window.q3d_gui.set_design(design)
 
-        self.variables_window.set_design(design)
+            self.variables_window.set_design(design)
 
-        # Refresh
-        self.refresh()
+            # Refresh
+            self.refresh()
 
     def _setup_logger(self):
         """Setup the logger."""
@@ -389,14 +563,21 @@ class MetalGUI(QMainWindowBaseHandler):
 
     def refresh_design(self):
         """Refresh design properties associated with the GUI."""
+        if self._refresh_suppressed:
+            self._dirty_design = True
+            return
         self.update_design_name()
 
     def update_design_name(self):
         """Update the design name."""
         if self.design:
             design_name = self.design.get_design_name()
-            self.main_window.setWindowTitle(self.config.main_window.title +
-                                            f' — {design_name}')
+            new_title = f'{self.config.main_window.title} — {design_name}'
+            # setWindowTitle updates the native window; skip if unchanged
+            if new_title == self._last_title:
+                return
+            self.main_window.setWindowTitle(new_title)
+            self._last_title = new_title
 
     def _ui_adjustments(self):
         """Any touchups to the loaded ui that need be done soon."""
@@ -523,8 +704,8 @@ class MetalGUI(QMainWindowBaseHandler):
                                              Qt.Vertical)
 
     def _move_dock_to_new_parent(self,
-                                 dock: QDockWidget,
-                                 new_parent: QMainWindow,
+                                 dock: 'QDockWidget',
+                                 new_parent: 'QMainWindow',
                                  dock_location=Qt.BottomDockWidgetArea):
         """The the doc to a different parent window.
 
@@ -565,6 +746,7 @@ class MetalGUI(QMainWindowBaseHandler):
             relative_index: QModelIndex of the desired QComponent file in the Qlibrary GUI display
 
         """
+        from .widgets.create_component_window import parameter_entry_window as pew
         try:
             self.param_window = pew.create_parameter_entry_window(
                 self, full_path, self.main_window)
@@ -578,16 +760,14 @@ class MetalGUI(QMainWindowBaseHandler):
 
         """
 
-        # getting absolute path of Qlibrary folder
-        init_qlibrary_abs_path = os.path.abspath(qlibrary.__file__)
-        qlibrary_abs_path = init_qlibrary_abs_path.split('__init__.py')[0]
-        self.QLIBRARY_ROOT = qlibrary_abs_path
-        self.QLIBRARY_FOLDERNAME = qlibrary.__name__
+        self.QLIBRARY_ROOT = _QLIBRARY_ROOT
+        self.QLIBRARY_FOLDERNAME = _QLIBRARY_FOLDERNAME
 
         # create model for Qlibrary directory
+        # The root path is only set once the library dock is first shown,
+        # see `_populate_library_widget`
         self.ui.dockLibrary.library_model = QFileSystemLibraryModel()
-
-        self.ui.dockLibrary.library_model.setRootPath(self.QLIBRARY_ROOT)
+        self._library_populated = False
 
         # QSortFilterProxyModel
         #QSortFilterProxyModel: sorting items, filtering out items, or both.  maps the original model indexes to new indexes, allows a given source model to be restructured as far as views are concerned without requiring any transformations on the underlying data, and without duplicating the data in memory.
@@ -597,10 +777,6 @@ class MetalGUI(QMainWindowBaseHandler):
 
         self.ui.dockLibrary_tree_view.setModel(
             self.ui.dockLibrary.proxy_library_model)
-        self.ui.dockLibrary_tree_view.setRootIndex(
-            self.ui.dockLibrary.proxy_library_model.mapFromSource(
-                self.ui.dockLibrary.library_model.index(
-                    self.ui.dockLibrary.library_model.rootPath())))
 
         self.ui.dockLibrary_tree_view.setItemDelegate(
             LibraryDelegate(self.main_window))  # try empty one if no work
@@ -613,6 +789,31 @@ class MetalGUI(QMainWindowBaseHandler):
         self.ui.dockLibrary_tree_view.viewport().setAttribute(Qt.WA_Hover, True)
         self.ui.dockLibrary_tree_view.viewport().setMouseTracking(True)
 
+        self.ui.dockLibrary.visibilityChanged.connect(
+            self._populate_library_widget)
+
+    def _populate_library_widget(self, visible: bool = True):
+        """Point the QLibrary model to the qlibrary folder.
+
+        Setting the root path makes the file system model start to walk and
+        watch the folder. This is deferred until the library dock is first
+        shown, which keeps it off the GUI startup path.
+
+        Args:
+            visible (bool): Whether the library dock is visible.  Defaults to True.
+        """
+        if not visible or self._library_populated:
+            return
+        self._library_populated = True
+        self.ui.dockLibrary.visibilityChanged.disconnect(
+            self._populate_library_widget)
+
+        self.ui.dockLibrary.library_model.setRootPath(self.QLIBRARY_ROOT)
+        self.ui.dockLibrary_tree_view.setRootIndex(
+            self.ui.dockLibrary.proxy_library_model.mapFromSource(
+                self.ui.dockLibrary.library_model.index(
+                    self.ui.dockLibrary.library_model.rootPath())))
+
     ################################################
     # UI
     def toggle_docks(self, do_hide: bool = None):
@@ -667,8 +868,9 @@ class MetalGUI(QMainWindowBaseHandler):
         Rebuild all components in the design from scratch and refresh the gui.
         """
 
-        self.design.rebuild()
-        self.refresh()
+        with self._RefreshGuard(self):
+            self.design.rebuild()
+            self.refresh()
         if autoscale:
             self.autoscale()
 
@@ -683,6 +885,9 @@ class MetalGUI(QMainWindowBaseHandler):
             This does *not* rebuild the components.
             For that, call rebuild.
         """
+        if self._refresh_suppressed:
+            self._dirty_design = self._dirty_table = self._dirty_plot = True
+            return
 
         # Global level
         self.refresh_design()
@@ -693,10 +898,35 @@ class MetalGUI(QMainWindowBaseHandler):
         # Redraw plots
         self.refresh_plot()
 
+    def post_refresh(self):
+        """Refresh everything once control returns to the Qt event loop.
+
+        Repeated calls made before the event loop runs are compacted
+        into a single `refresh`. Use from widgets that react to many
+        small edits.
+        """
+        self.main_window.post_call(self.refresh, key='refresh')
+
     def refresh_plot(self):
         """Redraw only the plot window contents."""
+        if self._refresh_suppressed:
+            self._dirty_plot = True
+            return
         self.plot_win.replot()
 
+    def _flush_refresh(self):
+        """Refresh, once, the parts of the GUI marked as dirty while a
+        `_RefreshGuard` was active."""
+        if self._dirty_design:
+            self._dirty_design = False
+            self.refresh_design()
+        if self._dirty_table:
+            self._dirty_table = False
+            self.ui.tableComponents.model().refresh()
+        if self._dirty_plot:
+            self._dirty_plot = False
+            self.refresh_plot()
+
     def autoscale(self):
         """Shortcut to autoscale all views."""
         self.plot_win.auto_scale()
@@ -744,6 +974,7 @@ class MetalGUI(QMainWindowBaseHandler):
         Args:
             _ (object, optional): Default parameters for slot  - used to call from action
         """
+        from .widgets.build_history.build_history_scroll_area import BuildHistoryScrollArea
         self.build_log_window = BuildHistoryScrollArea(
             self.design.build_logs.data())
         self.build_log_window.show()
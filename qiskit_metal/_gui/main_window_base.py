@@ -25,10 +25,9 @@ from PySide2.QtCore import QTimer
 from PySide2.QtGui import QIcon
 from PySide2.QtWidgets import QApplication, QFileDialog, QMainWindow, QMessageBox, QDockWidget
 
-from .. import Dict, config
+from .. import config
 from ..toolbox_python._logging import setup_logger
 from . import __version__
-from .main_window_ui import Ui_MainWindow
 from .utility._handle_qt_messages import slot_catch_error
 from .widgets.log_widget.log_metal import LogHandler_for_QTextLog
 
@@ -477,7 +477,7 @@ class QTreeModel_Base(QAbstractItemModel):
                             dic[lbl] = value
                         if self.optionstype == 'component':
                             self.component.rebuild()
-                            self.gui.refresh()
+                            self.gui.post_refresh()
                         return True
         return False
 
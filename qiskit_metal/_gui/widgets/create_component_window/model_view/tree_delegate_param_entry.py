@@ -15,8 +15,10 @@
 Delegate for Param Entry Window's MVD
 """
 
-from PySide2.QtCore import QAbstractItemModel, QModelIndex, Qt
-from PySide2.QtWidgets import QItemDelegate, QStyleOptionViewItem, QWidget
+from PySide2.QtCore import QAbstractItemModel, QModelIndex, QRect, QSize, Qt
+from PySide2.QtGui import QPainter, QPalette, QStaticText, QTransform
+from PySide2.QtWidgets import (QApplication, QItemDelegate, QStyle,
+                               QStyleOptionViewItem, QWidget)
 
 from qiskit_metal._gui.widgets.create_component_window.model_view.tree_model_param_entry import TreeModelParamEntry  # pylint: disable=line-too-long
 
@@ -27,6 +29,114 @@ class ParamDelegate(QItemDelegate):
     (such as QComboBoxes) for the Parameter Entry Window
     """
 
+    # Drop the cached text layouts and sizes once they hold this many entries.
+    _max_cache_size = 2048
+
+    def __init__(self, parent: QWidget = None):
+        """
+        Args:
+            parent (QWidget): Parent widget (Default: None)
+        """
+        super().__init__(parent)
+        # Both caches are keyed on the displayed text and the font, so an
+        # edit of the model data simply misses the cache.
+        self._static_text_cache = dict()
+        self._size_hint_cache = dict()
+
+    def _get_static_text(self, text: str, option: QStyleOptionViewItem):
+        """Get the QStaticText of text, laid out once for the font of option.
+
+        Args:
+            text (str): Text to display
+            option (QStyleOptionViewItem): Style options for the related view
+
+        Returns:
+            QStaticText: The prepared text
+        """
+        key = (text, option.font.key())
+        static_text = self._static_text_cache.get(key)
+        if static_text is None:
+            if len(self._static_text_cache) >= self._max_cache_size:
+                self._static_text_cache.clear()
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(QTransform(), option.font)
+            self._static_text_cache[key] = static_text
+        return static_text
+
+    def drawDisplay(self, painter: QPainter, option: QStyleOptionViewItem,
+                    rect: QRect, text: str):
+        """
+        Overriding inherited drawDisplay class, to draw the text of plain
+        cells from a cached QStaticText instead of laying it out on every
+        paint. As in QItemDelegate, the text is elided to fit and placed
+        according to the display alignment, within the style's text margin.
+        Selected and edited cells, which also need the highlight fill or the
+        editing outline, are drawn by QItemDelegate.
+
+        Args:
+            painter (QPainter): Painter of the view
+            option (QStyleOptionViewItem): Style options for the related view
+            rect (QRect): Area in which to draw the text
+            text (str): Text to display
+        """
+        if option.state & (QStyle.State_Selected | QStyle.State_Editing):
+            QItemDelegate.drawDisplay(self, painter, option, rect, text)
+            return
+
+        if not text:
+            return
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        text_margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None,
+                                        option.widget) + 1
+        text_rect = rect.adjusted(text_margin, 0, -text_margin, 0)
+
+        text = option.fontMetrics.elidedText(text, option.textElideMode,
+                                             text_rect.width())
+        static_text = self._get_static_text(text, option)
+        top_left = QStyle.alignedRect(option.direction,
+                                      option.displayAlignment,
+                                      static_text.size().toSize(),
+                                      text_rect).topLeft()
+
+        if not option.state & QStyle.State_Enabled:
+            color_group = QPalette.Disabled
+        elif not option.state & QStyle.State_Active:
+            color_group = QPalette.Inactive
+        else:
+            color_group = QPalette.Normal
+
+        painter.save()
+        painter.setClipRect(rect)
+        painter.setFont(option.font)
+        painter.setPen(option.palette.color(color_group, QPalette.Text))
+        painter.drawStaticText(top_left, static_text)
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem,
+                 index: QModelIndex) -> QSize:
+        """
+        Overriding inherited sizeHint class, caching the size
+        for each displayed text and font.
+
+        Args:
+            option (QStyleOptionViewItem): Style options for the related view
+            index (QModelIndex): Index of the item
+
+        Returns:
+            QSize: The size needed to display the item
+        """
+        text = index.model().data(index, Qt.DisplayRole)
+        key = (index.column(), text, option.font.key())
+        size = self._size_hint_cache.get(key)
+        if size is None:
+            if len(self._size_hint_cache) >= self._max_cache_size:
+                self._size_hint_cache.clear()
+            size = QItemDelegate.sizeHint(self, option, index)
+            self._size_hint_cache[key] = size
+        return size
+
     def createEditor(self, parent: QWidget, option: QStyleOptionViewItem,
                      index: QModelIndex) -> QWidget:
         """
@@ -119,13 +119,14 @@ class BranchNode(Node):
         """
         Contains all possible types for values in a DEB
         """
+        # Items of the combobox, built once for all editors.
+        item_names = tuple(branch_type_names)
 
         def __init__(self, parent=None):
             """ Inits Combobox"""
             super().__init__(parent)
             self.setAutoFillBackground(True)  # must be set for adding to tree
-            for btn in self.branch_type_names:
-                self.addItem(btn)
+            self.addItems(self.item_names)
 
         def getType(self):  # pylint: disable=invalid-name disable=inconsistent-return-statements
             """ Return Type """
@@ -281,18 +282,14 @@ class LeafNode(Node):
             npArr: lambda a: json.dumps(a, cls=NpEncoder),
             pylist: lambda a: json.dumps(a, cls=NpEncoder),
         }
+        # Items of the combobox, built once for all editors.
+        item_names = ("str", "float", "int", "bool", npArr, pylist)
 
         def __init__(self, parent=None):
             """ Inits Leaf Combobox"""
             super().__init__(parent)
             self.setAutoFillBackground(True)  # must be set for adding to tree
-            self.addItem("str")
-            self.addItem("float")
-            self.addItem("int")
-            self.addItem("bool")
-
-            self.addItem(self.npArr)
-            self.addItem(self.pylist)
+            self.addItems(self.item_names)
             self.np_enc = NpEncoder
 
         def getType(self):  # pylint: disable=invalid-name
@@ -445,6 +445,11 @@ def dockify(main_window, docked_title, gui):
     return dock
 
 
+# QComponent classes already resolved by get_class_from_abs_file_path,
+# keyed by absolute file path
+_QCOMPONENT_CLASS_CACHE = dict()
+
+
 def get_class_from_abs_file_path(abs_file_path: str):
     """
     Gets the corresponding class object for the absolute file path to the file containing that
@@ -456,7 +461,13 @@ def get_class_from_abs_file_path(abs_file_path: str):
     getting class from absolute file path -
     https://stackoverflow.com/questions/452969/does-python-have-an-equivalent-to-java-class-forname
 
+    The class is cached per file path, so that opening the same QComponent
+    again does not repeat the module lookup and the scan of its members.
     """
+    abs_file_path = os.path.abspath(abs_file_path)
+    if abs_file_path in _QCOMPONENT_CLASS_CACHE:
+        return _QCOMPONENT_CLASS_CACHE[abs_file_path]
+
     qis_abs_path = abs_file_path[abs_file_path.index(__name__.split('.')[0]):]
 
     # Windows users' qis_abs_path may use os.sep or '/' due to PySide's
@@ -471,6 +482,7 @@ def get_class_from_abs_file_path(abs_file_path: str):
     for memtup in members:
         if len(memtup) > 1:
             if str(memtup[1].__module__).endswith(class_owner):
+                _QCOMPONENT_CLASS_CACHE[abs_file_path] = memtup[1]
                 return memtup[1]
 
 
@@ -262,7 +262,7 @@ class QTableModel_Options(QAbstractTableModel):
                         data[key] = processed_value
 
                     self.component.rebuild()
-                    self.gui.refresh()
+                    self.gui.post_refresh()
 
                 # except and finally restore the value
                 return True
@@ -17,15 +17,63 @@ Delegate for display of QComponents in Library tab
 
 import importlib
 import inspect
+import json
 import os
+from pathlib import Path
 
-from PySide2.QtCore import QAbstractItemModel, QAbstractProxyModel, QModelIndex, Signal
+from PySide2.QtCore import QAbstractItemModel, QAbstractProxyModel, QModelIndex, QTimer, Signal
 from PySide2.QtGui import QPainter
 from PySide2.QtWidgets import QItemDelegate, QStyle, QStyleOptionViewItem, QWidget
 
 from qiskit_metal._gui.widgets.qlibrary_display.file_model_qlibrary import QFileSystemLibraryModel
 from qiskit_metal.toolbox_metal.exceptions import QLibraryGUIException
 
+# On-disk index of the QComponent tooltips shown in the QLibrary tab
+TOOL_TIP_INDEX_PATH = Path.home() / '.qiskit_metal' / 'qlib_index.json'
+
+# Delay, in ms, between the last new tooltip and the write of the index
+_TOOL_TIP_INDEX_SAVE_DELAY = 2000
+
+
+def load_tool_tip_index(path: Path = TOOL_TIP_INDEX_PATH) -> dict:
+    """Load the tooltip index saved by `save_tool_tip_index`.
+
+    Args:
+        path (Path): Location of the index.  Defaults to TOOL_TIP_INDEX_PATH.
+
+    Returns:
+        dict: {file path: (modification time, tooltip)}. Empty if the index
+        does not exist or cannot be read. Malformed entries are dropped.
+    """
+    try:
+        with open(path, 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return dict()
+    if not isinstance(index, dict):
+        return dict()
+    return {
+        full_path: (entry[0], entry[1])
+        for full_path, entry in index.items()
+        if isinstance(entry, list) and len(entry) == 2 and
+        isinstance(entry[0], (int, float)) and isinstance(entry[1], str)
+    }
+
+
+def save_tool_tip_index(index: dict, path: Path = TOOL_TIP_INDEX_PATH):
+    """Save the tooltip index as JSON, ignoring file system errors.
+
+    Args:
+        index (dict): {file path: (modification time, tooltip)}
+        path (Path): Location of the index.  Defaults to TOOL_TIP_INDEX_PATH.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(index, f)
+    except OSError:
+        pass
+
 
 class LibraryDelegate(QItemDelegate):
     """
@@ -47,6 +95,18 @@ class LibraryDelegate(QItemDelegate):
         #  the source model for that Proxy Model(s) should be a QFileSystemLibraryModel
         self.source_model_type = QFileSystemLibraryModel
 
+        # Tooltips already looked up in this session, by file path
+        self._tool_tips = dict()
+        # Tooltips from previous sessions, validated by modification time
+        self._tool_tip_index = load_tool_tip_index()
+
+        # New tooltips are written to disk once, after a burst of lookups,
+        # rather than on every miss from within paint()
+        self._save_index_timer = QTimer(self)
+        self._save_index_timer.setSingleShot(True)
+        self._save_index_timer.setInterval(_TOOL_TIP_INDEX_SAVE_DELAY)
+        self._save_index_timer.timeout.connect(self.save_tool_tip_index)
+
     def get_source_model(self, model: QAbstractItemModel, source_type: type):  # pylint: disable=R0201, no-self-use
         """
         The Delegate may belong to a view using a ProxyModel. However,
@@ -111,14 +171,50 @@ class LibraryDelegate(QItemDelegate):
             model = index.model()
             full_path = source_model.filePath(model.mapToSource(index))
 
-            # try:
+            self.tool_tip_signal.emit(self.get_tool_tip(full_path))
+
+    def get_tool_tip(self, full_path: str) -> str:
+        """Get the TOOLTIP of the QComponent defined in a file.
+
+        Importing the QComponent module is only needed the first time a file
+        is seen, or after it has been modified. The result is cached for the
+        session, and the on-disk tooltip index is saved shortly after.
+
+        Args:
+            full_path (str): Absolute path of the QComponent file
+
+        Returns:
+            str: The TOOLTIP, or an empty string if there is none
+        """
+        information = self._tool_tips.get(full_path)
+        if information is not None:
+            return information
+
+        try:
+            mtime = os.path.getmtime(full_path)
+        except OSError:
+            mtime = None
+
+        cached = self._tool_tip_index.get(full_path)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            information = cached[1]
+        else:
             try:
                 current_class = self.get_class_from_abs_file_path(full_path)
-                information = current_class.TOOLTIP
+                information = str(current_class.TOOLTIP)
             except:
                 information = ""
+            if mtime is not None:
+                self._tool_tip_index[full_path] = (mtime, information)
+                self._save_index_timer.start()
+
+        self._tool_tips[full_path] = information
+        return information
 
-            self.tool_tip_signal.emit(information)
+    def save_tool_tip_index(self):
+        """Write the tooltip index to disk."""
+        self._save_index_timer.stop()
+        save_tool_tip_index(self._tool_tip_index)
 
     def get_class_from_abs_file_path(self, abs_file_path):
         """
@@ -58,8 +58,7 @@ class TreeViewQLibrary(QTreeView):
         super().setModel(model)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent):
-        """Overrides inherited mousePressEvent to emit appropriate filepath signals
-         based on which columns were clicked, and to allow user to clear any selections
+        """Overrides inherited mousePressEvent to allow user to clear any selections
         by clicking off the displayed tree.
 
         Args:
@@ -71,7 +70,24 @@ class TreeViewQLibrary(QTreeView):
         if index.row() == -1:
             self.clearSelection()
             self.setCurrentIndex(QModelIndex())
-            return super().mousePressEvent(event)
+
+        return super().mousePressEvent(event)
+
+    def mouseDoubleClickEvent(self, event: QtGui.QMouseEvent):
+        """Overrides inherited mouseDoubleClickEvent to emit appropriate filepath signals
+        based on which columns were double-clicked.
+
+        Opening a QComponent imports its file, so it is only done on a double
+        click; single clicks are left for navigating the tree.
+
+        Args:
+            event (QtGui.QMouseEvent): QMouseEvent triggered by user
+        """
+
+        index = self.indexAt(event.pos())
+
+        if index.row() == -1:
+            return super().mouseDoubleClickEvent(event)
 
         model = self.model()
         source_model = self.model().sourceModel()
@@ -83,7 +99,7 @@ class TreeViewQLibrary(QTreeView):
                                          index(__name__.split('.')[0]):]
                 self.qlibrary_filepath_signal.emit(qis_abs_path)
 
-        return super().mousePressEvent(event)
+        return super().mouseDoubleClickEvent(event)
 
     def setToolTip(self, qcomp_tooltip: str):
         """
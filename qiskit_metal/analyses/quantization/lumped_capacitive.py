@@ -257,17 +257,12 @@ def extract_transmon_coupled_Noscillator(capMatrix,
 
     # Cbus (qubit pads to coupling pads)
     # index is ordered as [readout,bus1,...]
-    Cbus = np.zeros([2, N])
-    for ii in range(2):
-        for jj in range(N):
-            Cbus[ii, jj] = -capMatrix[qubit_index[ii], bus_index[jj]]
+    capMatrix = np.asarray(capMatrix, dtype=float)
+    Cbus = -capMatrix[np.ix_(qubit_index, bus_index)]
 
     # crosspad capacitance
-    Cbusbus = np.zeros([N, N])
-    for ii in range(N):
-        for jj in range(N):
-            if ii != jj:
-                Cbusbus[ii, jj] = -capMatrix[bus_index[ii], bus_index[jj]]
+    Cbusbus = -capMatrix[np.ix_(bus_index, bus_index)]
+    np.fill_diagonal(Cbusbus, 0)
 
     # sum of capacitances from each pad to ground
     # this assumes the bus couplers are at "ground"
@@ -279,20 +274,15 @@ def extract_transmon_coupled_Noscillator(capMatrix,
 
     # total capacitance of each pad to ground?
     # Note the + in the squared term below !!!
-    tCSbus = np.zeros(N)
-    for ii in range(N):
-        tCSbus[ii] = Cr[ii] - (Cbus[0, ii]+Cbus[1, ii])**2 / \
-            (C1S+C2S) + np.sum(Cbus[:, ii]) + np.sum(Cbusbus[ii, :])
+    Cbus_pads = Cbus[0,] + Cbus[1,]
+    tCSbus = Cr - Cbus_pads**2 / (C1S + C2S) + Cbus_pads + \
+        np.sum(Cbusbus, axis=1)
 
     # qubit to coupling pad capacitance
     tCqbus = (C2S * Cbus[0,] - Cbus[1,] * C1S) / (C1S + C2S)
 
     # coupling pad to coupling pad capacitance
-    tCqbusbus = np.zeros([N, N])
-    for ii in range(N):
-        for jj in range(N):
-            tCqbusbus[ii, jj] = Cbusbus[ii, jj] + \
-                (Cbus[0, ii]+Cbus[1, ii])*(Cbus[0, jj]+Cbus[1, jj])/(C1S+C2S)
+    tCqbusbus = Cbusbus + np.outer(Cbus_pads, Cbus_pads) / (C1S + C2S)
 
     # voltage division ratio
     bbus = (C2S * Cbus[0,] - Cbus[1,] * C1S) / ((C1S + C2S) * Cs + C1S * C2S)
@@ -334,11 +324,7 @@ def extract_transmon_coupled_Noscillator(capMatrix,
     gbus_in_MHz = gqbus / 1e6 / 2 / np.pi
 
     # g's between pads
-    gbusbus = np.zeros([N, N])
-    for ii in range(N):
-        for jj in range(N):
-            gbusbus[ii,
-                    jj] = (0.01) * tCqbusbus[ii, jj] / (tCSbus[ii] * tCSbus[jj])
+    gbusbus = (0.01) * tCqbusbus / np.outer(tCSbus, tCSbus)
 
     ########################################################
     ##### Purcell, Qs, dissipative
@@ -760,13 +746,15 @@ def lumped_oscillator_from_path(path: str, Lj_nH: float, Cj_fF: float, N: int,
     ureg = UnitRegistry()
     IC_Amps = Convert.Ic_from_Lj(Lj_nH, 'nH', 'A')
     CJ = ureg(f'{Cj_fF} fF').to('farad').magnitude
-    fr = ureg(f'{fr} GHz').to('GHz').magnitude
-    fb = [ureg(f'{freq} GHz').to('GHz').magnitude for freq in fb]
+    # frequencies are given in GHz and used in GHz: no unit conversion
+    fr = float(fr)
+    fb = [float(freq) for freq in fb]
 
     df_cmat, user_units, _, _, = load_q3d_capacitance_matrix(path)
     c_units = ureg(user_units).to('farads').magnitude
 
-    RES = extract_transmon_coupled_Noscillator(df_cmat.values * c_units,
+    cmat = df_cmat.to_numpy(dtype=float) * c_units
+    RES = extract_transmon_coupled_Noscillator(cmat,
                                                IC_Amps,
                                                CJ,
                                                N,
@@ -776,8 +764,8 @@ def lumped_oscillator_from_path(path: str, Lj_nH: float, Cj_fF: float, N: int,
                                                print_info=True)
 
     RES = pd.DataFrame([RES])
-    RES['χr MHz'] = abs(RES['chi_in_MHz'].apply(lambda x: x[0]))
-    RES['gr MHz'] = abs(RES['gbus'].apply(lambda x: x[0]))
+    RES['χr MHz'] = np.abs(np.stack(RES['chi_in_MHz'].to_numpy())[:, 0])
+    RES['gr MHz'] = np.abs(np.stack(RES['gbus'].to_numpy())[:, 0])
     return RES
 
 
@@ -825,7 +813,7 @@ def df_reorder_matrix_basis(df, i_from, i_to):
     Returns:
         DataFrame: The changed index DataFrame
     """
-    arr = df.values
+    arr = df.to_numpy()
     idx = move_index_to(i_from, i_to, len(arr))
     arr = arr[np.ix_(idx, idx)]
     # Maybe make copy
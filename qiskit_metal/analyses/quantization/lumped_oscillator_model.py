@@ -12,6 +12,7 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import numpy as np
 import pandas as pd
 from pint import UnitRegistry
 
@@ -146,13 +147,14 @@ class LOManalysis(QAnalysis):
             return
         if not self.sim.capacitance_all_passes:
             self.sim.capacitance_all_passes[
-                1] = self.sim.capacitance_matrix.values
+                1] = self.sim.capacitance_matrix.to_numpy()
 
         ureg = UnitRegistry()
         ic_amps = Convert.Ic_from_Lj(s.junctions.Lj, 'nH', 'A')
         cj = ureg(f'{s.junctions.Cj} fF').to('farad').magnitude
-        fread = ureg(f'{s.freq_readout} GHz').to('GHz').magnitude
-        fbus = [ureg(f'{freq} GHz').to('GHz').magnitude for freq in s.freq_bus]
+        # frequencies are given in GHz and used in GHz: no unit conversion
+        fread = float(s.freq_readout)
+        fbus = [float(freq) for freq in s.freq_bus]
 
         # derive number of coupling pads
         num_cpads = 2
@@ -176,9 +178,12 @@ class LOManalysis(QAnalysis):
                     idx_cmat == len(self.sim.capacitance_all_passes)))
             all_res[idx_cmat] = res
         self.lumped_oscillator = all_res[len(self.sim.capacitance_all_passes)]
-        all_res = pd.DataFrame(all_res).transpose()
-        all_res['χr MHz'] = abs(all_res['chi_in_MHz'].apply(lambda x: x[0]))
-        all_res['gr MHz'] = abs(all_res['gbus'].apply(lambda x: x[0]))
+        all_res = pd.DataFrame.from_dict(all_res, orient='index')
+        # every pass has the same number of buses: gather the first one of
+        # all passes at once, rather than row by row
+        all_res['χr MHz'] = np.abs(
+            np.stack(all_res['chi_in_MHz'].to_numpy())[:, 0])
+        all_res['gr MHz'] = np.abs(np.stack(all_res['gbus'].to_numpy())[:, 0])
         self.lumped_oscillator_all = all_res
         return self.lumped_oscillator_all
 
@@ -13,13 +13,72 @@
 # that they have been altered from the originals.
 """ Sweep a qcomponent option, and get results of analysis."""
 # pylint: disable=too-many-lines
-from typing import Tuple, Union
+from typing import Tuple, Union, TYPE_CHECKING
+import numpy as np
 import pandas as pd
 
 from qiskit_metal import Dict
-# pylint: disable=unused-import
-# QHFSSRenderer used to describe types in arguments.
-from qiskit_metal.renderers.renderer_ansys.hfss_renderer import QHFSSRenderer
+from qiskit_metal.qlibrary.core import QRoute
+from qiskit_metal.qlibrary.tlines.anchored_path import RouteAnchors
+from qiskit_metal.qlibrary.tlines.pathfinder import RoutePathfinder
+
+if TYPE_CHECKING:
+    # The renderers are only used to describe types in arguments.
+    from qiskit_metal.designs.design_base import QDesign
+    from qiskit_metal.qlibrary.core import QComponent
+    from qiskit_metal.renderers.renderer_ansys.hfss_renderer import (
+        QHFSSRenderer)
+    from qiskit_metal.renderers.renderer_ansys.q3d_renderer import (
+        QQ3DRenderer)
+
+# Marks a key missing from an options Dict, since None can be a value.
+_MISSING = object()
+
+# Accepted types for a float argument.  An int is stored as a float.
+_NUMBER = (int, float)
+
+# Allowed values of solution_order for the Q3D setup.
+_SOLUTION_ORDERS = frozenset(["High", "Normal", "Higher", "Highest"])
+
+# Expected data type of each key of setup_args, for each kind of setup.
+# Key: (type or frozenset of allowed str values, name of the type for
+# warnings).
+# A value of None is always accepted; the renderer default is then used.
+_DM_SETUP_SCHEMA = {
+    'freq_ghz': (_NUMBER, 'float'),
+    'max_delta_s': (_NUMBER, 'float'),
+    'max_passes': (int, 'int'),
+    'min_passes': (int, 'int'),
+    'min_converged': (int, 'int'),
+    'basis_order': (int, 'int'),
+    'pct_refinement': (int, 'int'),
+}
+
+_EM_SETUP_SCHEMA = {
+    'min_freq_ghz': (int, 'int'),
+    'n_modes': (int, 'int'),
+    'max_delta_f': (_NUMBER, 'float'),
+    'max_passes': (int, 'int'),
+    'min_passes': (int, 'int'),
+    'min_converged': (int, 'int'),
+    'basis_order': (int, 'int'),
+    'pct_refinement': (int, 'int'),
+}
+
+_Q3D_SETUP_SCHEMA = {
+    'freq_ghz': (_NUMBER, 'float'),
+    'max_passes': (int, 'int'),
+    'min_passes': (int, 'int'),
+    'percent_error': (_NUMBER, 'float'),
+    'save_fields': (bool, 'bool'),
+    'enabled': (bool, 'bool'),
+    'min_converged_passes': (int, 'int'),
+    'percent_refinement': (int, 'int'),
+    'auto_increase_solution_order': (bool, 'bool'),
+    'solution_order':
+        (_SOLUTION_ORDERS, 'str in ["High", "Normal", "Higher", "Highest"]'),
+    'solver_type': (str, 'str'),
+}
 
 
 class Sweeping():
@@ -50,6 +109,33 @@ class Sweeping():
         value = a_dict[search]
         return value
 
+    @staticmethod
+    def sweep_to_dataframe(all_sweep: Dict) -> pd.DataFrame:
+        """Arrange the Dict returned by a sweep in columns, one row per value
+        of the swept option, so the results can be compared or plotted
+        without walking the Dict.
+
+        Args:
+            all_sweep (Dict): Output of one of the sweep_one_option methods.
+
+        Returns:
+            pd.DataFrame: Indexed by the values of the swept option, with a
+            column for each key of the solution-data.  A key missing for
+            a value, such as the matrices of a drivenmodal sweep without
+            ports, holds NaN.
+        """
+        columns = dict()
+        for item, sweep_values in all_sweep.items():
+            for key, value in sweep_values.items():
+                columns.setdefault(key, dict())[item] = value
+
+        return pd.DataFrame(
+            {
+                key: pd.Series(values, dtype=object)
+                for key, values in columns.items()
+            },
+            index=list(all_sweep.keys()))
+
     def error_check_sweep_input(self, qcomp_name: str, option_name: str,
                                 option_sweep: list) -> Tuple[list, Dict, int]:
         """ Implement error checking of data for sweeping.
@@ -70,6 +156,7 @@ class Sweeping():
             * 2 option_name is empty.
             * 3 option_name is not found as key in Dict.
             * 4 option_sweep is empty, need at least one entry.
+            * 5 last key in option_name is not in dict.
         """
         option_path = None
         a_value = None
@@ -91,14 +178,79 @@ class Sweeping():
 
         # All but the last item in list.
         for name in option_path[:-1]:
-            if name in a_value:
-                a_value = self.option_value(a_value, name)
-            else:
+            next_value = a_value.get(name, _MISSING)
+            if next_value is _MISSING:
                 self.design.logger.warning(f'Key="{name}" is not in dict.')
                 return option_path, a_value, 3
+            a_value = next_value
+
+        # Check the last item before any call to Ansys by the sweep.
+        if option_path[-1] not in a_value:
+            self.design.logger.warning(
+                f'Key="{option_path[-1]}" is not in dict.')
+            return option_path, a_value, 5
 
         return option_path, a_value, 0
 
+    @staticmethod
+    def _avoids_collisions(qcomp: 'QComponent') -> bool:
+        """Whether qcomp is a route that steers around the other components
+        of the design, and so depends on their geometry.
+
+        Args:
+            qcomp (QComponent): A component of the design.
+
+        Returns:
+            bool: True for a RoutePathfinder, or a RouteAnchors with
+            advanced.avoid_collision set.
+        """
+        if isinstance(qcomp, RoutePathfinder):
+            return True
+        if isinstance(qcomp, RouteAnchors):
+            return bool(
+                qcomp.parse_value(qcomp.options.advanced.avoid_collision))
+        return False
+
+    def components_to_rebuild(self, qcomp_name: str) -> list:
+        """Get the QComponents to rebuild after an option of qcomp_name
+        changes.  A QRoute connected to a pin of a rebuilt component reads
+        the position of that pin, so it is rebuilt as well.  A route that
+        avoids collisions reads the bounding boxes of all the components,
+        so it is always rebuilt.  The other components in the design do not
+        change.
+
+        Args:
+            qcomp_name (str): Component that contains the swept option.
+
+        Returns:
+            list: The QComponents to rebuild, in the order of
+            design.components.
+        """
+        components = self.design._components  # pylint: disable=protected-access
+        net_info = self.design.net_info
+        comp_to_nets = net_info.groupby('component_id')['net_id'].apply(set)
+        net_to_comps = net_info.groupby('net_id')['component_id'].apply(set)
+
+        qcomp_id = self.design.components[qcomp_name].id
+        to_rebuild = {qcomp_id}
+        to_search = [qcomp_id]
+        while to_search:
+            comp_id = to_search.pop()
+            for net_id in comp_to_nets.get(comp_id, ()):
+                for other_id in net_to_comps[net_id]:
+                    if other_id not in to_rebuild and isinstance(
+                            components[other_id], QRoute):
+                        to_rebuild.add(other_id)
+                        to_search.append(other_id)
+
+        to_rebuild.update(comp_id for comp_id, qcomp in components.items()
+                          if self._avoids_collisions(qcomp))
+
+        return [
+            qcomp for comp_id, qcomp in components.items()
+            if comp_id in to_rebuild
+        ]
+
     def prep_drivenmodal_setup(self, setup_args: Dict) -> int:
         """User can pass arguments for method drivenmodal setup.  If not passed,
         method will use the options in HFSS default_options. The name of setup
@@ -131,60 +283,20 @@ class Sweeping():
                 * 0 Setup of "Sweep_dm_setup" added to design with setup_args.
                 * 1 Look at warning message to determine which argument was of
                   the wrong data type.
-                * 2 Look at warning message, a key in setup_args that was
-                  not expected.
+                * 2 Look at warning message, the keys in setup_args that
+                  were not expected.
         """
-        # pylint: disable=too-many-branches
-        # pylint: disable=too-many-return-statements
-
         a_hfss = self.design.renderers.hfss
+        #For this method, "Sweep_dm_setup" used.
         setup_args.name = "Sweep_dm_setup"
-        a_hfss.pinfo.design.delete_setup(setup_args.name)
 
-        for key, value in setup_args.items():
-            if key == "name":
-                continue  #For this method, "Sweep_dm_setup" used.
-            if key == "freq_ghz":
-                if isinstance(value, float) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "float")
-                return 1
-            if key == "max_delta_s":
-                if isinstance(value, float) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "float")
-                return 1
-            if key == 'max_passes':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'min_passes':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'min_converged':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'basis_order':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'pct_refinement':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
+        # Check the arguments before any call to Ansys.
+        check_result = self.check_setup_args(setup_args, _DM_SETUP_SCHEMA)
+        if check_result != 0:
+            return check_result
 
-            self.design.logger.warning(
-                f'The key={key} is not expected.  Do you have a typo?  '
-                f'The setup was not added to design. '
-                f'Sweep will not be implemented.')
-            return 2
+        # delete_setup only deletes the setup if it is in the design.
+        a_hfss.pinfo.design.delete_setup(setup_args.name)
 
         a_hfss.new_ansys_setup(**setup_args)
         a_hfss.activate_ansys_setup(setup_args.name)
@@ -225,68 +337,70 @@ class Sweeping():
                 * 0 Setup of "Sweep_em_setup" added to design with setup_args.
                 * 1 Look at warning message to determine which argument was of
                   the wrong data type.
-                * 2 Look at warning message, a key in setup_args that was
-                  not expected.
+                * 2 Look at warning message, the keys in setup_args that
+                  were not expected.
         """
-        # pylint: disable=too-many-branches
-        # pylint: disable=too-many-return-statements
-
         a_hfss = self.design.renderers.hfss
+        #For this method, "Sweep_em_setup" used.
         setup_args.name = "Sweep_em_setup"
+
+        # Check the arguments before any call to Ansys.
+        check_result = self.check_setup_args(setup_args, _EM_SETUP_SCHEMA)
+        if check_result != 0:
+            return check_result
+
+        # delete_setup only deletes the setup if it is in the design.
         a_hfss.pinfo.design.delete_setup(setup_args.name)
 
-        for key, value in setup_args.items():
-            if key == "name":
-                continue  #For this method, "Sweep_em_setup" used.
-            if key == "min_freq_ghz":
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == "n_modes":
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == "max_delta_f":
-                if isinstance(value, float) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "float")
-                return 1
-            if key == 'max_passes':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'min_passes':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'min_converged':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'basis_order':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'pct_refinement':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
+        a_hfss.new_ansys_setup(**setup_args)
+        a_hfss.activate_ansys_setup(setup_args.name)
+        return 0
+
+    def check_setup_args(self, setup_args: Dict, schema: dict) -> int:
+        """Check the data type of each value of setup_args, using a schema.
+
+        Args:
+            setup_args (Dict): Holds the key/value of setup arguments.
+                        The key "name" is not checked.
+            schema (dict): For each expected key, a tuple of the expected
+                        type (or frozenset of allowed str values), and the
+                        name of the type to use in warnings.  An int given
+                        for a float argument is converted to float in
+                        setup_args.
 
+        Returns:
+            int: The return code of status.
+                * 0 All the values of setup_args have the expected type.
+                * 1 Look at warning message to determine which argument was of
+                  the wrong data type.
+                * 2 Look at warning message, the keys in setup_args that
+                  were not expected.
+        """
+        unexpected = setup_args.keys() - schema.keys() - {"name"}
+        if unexpected:
             self.design.logger.warning(
-                f'The key={key} is not expected.  Do you have a typo?  '
+                f'The keys={sorted(unexpected)} are not expected.  '
+                f'Do you have a typo?  '
                 f'The setup was not added to design. '
                 f'Sweep will not be implemented.')
             return 2
 
-        a_hfss.new_ansys_setup(**setup_args)
-        a_hfss.activate_ansys_setup(setup_args.name)
+        for key, value in setup_args.items():
+            if key == "name" or value is None:
+                continue
+            expected, data_type = schema[key]
+            if isinstance(expected, frozenset):
+                is_valid = isinstance(value, str) and value in expected
+            elif expected is _NUMBER:
+                is_valid = (isinstance(value, _NUMBER) and
+                            not isinstance(value, bool))
+                if is_valid:
+                    setup_args[key] = float(value)
+            else:
+                is_valid = isinstance(value, expected)
+            if not is_valid:
+                self.warning_for_setup(setup_args, key, data_type)
+                return 1
         return 0
 
     def warning_for_setup(self, setup_args: Dict, key: str, data_type: str):
@@ -350,85 +464,17 @@ class Sweeping():
                 * 2 Look at warning message, a key in setup_args that was not
                         expected.
         """
-        # pylint: disable=too-many-statements
-        # pylint: disable=too-many-branches
-        # pylint: disable=too-many-return-statements
-
         a_q3d = self.design.renderers.q3d
+        #For this method, "Sweep_q3d_setup" used.
         setup_args.name = "Sweep_q3d_setup"
-        a_q3d.pinfo.design.delete_setup(setup_args.name)
 
-        for key, value in setup_args.items():
-            if key == "name":
-                continue  #For this method, "Sweep_q3d_setup" used.
-            if key == "freq_ghz":
-                if isinstance(value, float) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "float")
-                return 1
-            if key == 'max_passes':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'min_passes':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'percent_error':
-                if isinstance(value, float) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "float")
-                return 1
-            if key == 'save_fields':
-                if isinstance(value, bool) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "bool")
-                return 1
-            if key == 'enabled':
-                if isinstance(value, bool) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "bool")
-                return 1
-            if key == 'min_converged_passes':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'percent_refinement':
-                if isinstance(value, int) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "int")
-                return 1
-            if key == 'auto_increase_solution_order':
-                if isinstance(value, bool) or value is None:
-                    continue
-                self.warning_for_setup(setup_args, key, "bool")
-                return 1
-            if key == 'solution_order':
-                if (isinstance(value, str) and
-                        value in ["High", "Normal", "Higher", "Highest"
-                                 ]) or value is None:
-                    continue
-                self.design.logger.warning(
-                    f'The value for solution_order should be a str '
-                    f'in ["High", "Normal", "Higher", "Highest"]. '
-                    f'The present value is {value}.  '
-                    f'Sweep will not be implemented.')
-                return 1
-            if key == 'solver_type':
-                if isinstance(value, str) or value is None:
-                    continue
-
-                self.warning_for_setup(setup_args, key, "str")
-                return 1
+        # Check the arguments before any call to Ansys.
+        check_result = self.check_setup_args(setup_args, _Q3D_SETUP_SCHEMA)
+        if check_result != 0:
+            return check_result
 
-            self.design.logger.warning(
-                f'The key={key} is not expected.  Do you have a typo?  '
-                f'The setup was not added to design. '
-                f'Sweep will not be implemented.')
-            return 2
+        # delete_setup only deletes the setup if it is in the design.
+        a_q3d.pinfo.design.delete_setup(setup_args.name)
 
         a_q3d.new_ansys_setup(**setup_args)
         a_q3d.activate_ansys_setup(setup_args.name)
@@ -518,17 +564,20 @@ class Sweeping():
                 'The setup was not implemented, look at warning messages.')
             return all_sweep, 8
 
+        # Results are keyed by item, so a repeated value would be rendered
+        # and analyzed again only to overwrite the same entry.
+        option_sweep = list(dict.fromkeys(option_sweep))
         len_sweep = len(option_sweep) - 1
+        option_key = option_path[-1]
+        rebuild_qcomps = self.components_to_rebuild(qcomp_name)
+        # The setup is the same for every item of the sweep.
+        setup_name = a_hfss.pinfo.setup.name
 
         for index, item in enumerate(option_sweep):
-            if option_path[-1] in a_value.keys():
-                a_value[option_path[-1]] = item
-            else:
-                self.design.logger.warning(
-                    f'Key="{option_path[-1]}" is not in dict.')
-                return all_sweep, 5
+            a_value[option_key] = item
 
-            self.design.rebuild()
+            for qcomp in rebuild_qcomps:
+                qcomp.rebuild()
 
             a_hfss.render_design(selection=qcomp_render,
                                  open_pins=endcaps_render,
@@ -536,13 +585,8 @@ class Sweeping():
                                  box_plus_buffer=box_plus_buffer_render
                                 )  #Render the items chosen
 
-            a_hfss.analyze_setup(
-                a_hfss.pinfo.setup.name)  #Analyze said solution setup.
-            setup = a_hfss.pinfo.setup
-            #solution_name = setup.solution_name
-            all_solutions = setup.get_solutions()
-            #setup_names = all_solutions.list_variations()
-            freqs, kappa_over_2pis = all_solutions.eigenmodes()
+            a_hfss.analyze_setup(setup_name)  #Analyze said solution setup.
+            freqs, kappa_over_2pis = a_hfss.get_eigenmodes()
             df_t, df_f, _, convergence = self.hfss_em_get_convergence(a_hfss)
 
             if not convergence:
@@ -552,7 +596,7 @@ class Sweeping():
             sweep_values = Dict()
 
             sweep_values['convergence'] = convergence
-            sweep_values['option_name'] = option_path[-1]
+            sweep_values['option_name'] = option_key
             sweep_values['frequency'] = freqs
             sweep_values['kappa_over_2pis'] = kappa_over_2pis
             sweep_values['quality_factor'] = self.get_quality_factor(
@@ -563,11 +607,8 @@ class Sweeping():
             all_sweep[item] = sweep_values
 
             #Decide if need to clean the design.
-            obj_names = a_hfss.pinfo.get_all_object_names()
-            if obj_names:
-                if index == len_sweep and not leave_last_design:
-                    a_hfss.clean_active_design()
-                elif index != len_sweep:
+            if index != len_sweep or not leave_last_design:
+                if a_hfss.pinfo.get_all_object_names():
                     a_hfss.clean_active_design()
 
         a_hfss.disconnect_ansys()
@@ -774,17 +815,18 @@ class Sweeping():
         if self.error_check_render_design_args(dm_render_args) != 0:
             return all_sweep, 9
 
+        # Results are keyed by item, so a repeated value would be rendered
+        # and analyzed again only to overwrite the same entry.
+        option_sweep = list(dict.fromkeys(option_sweep))
         len_sweep = len(option_sweep) - 1
+        option_key = option_path[-1]
+        rebuild_qcomps = self.components_to_rebuild(qcomp_name)
 
         for index, item in enumerate(option_sweep):
-            if option_path[-1] in a_value.keys():
-                a_value[option_path[-1]] = item
-            else:
-                self.design.logger.warning(
-                    f'Key="{option_path[-1]}" is not in dict.')
-                return all_sweep, 5
+            a_value[option_key] = item
 
-            self.design.rebuild()
+            for qcomp in rebuild_qcomps:
+                qcomp.rebuild()
 
             a_hfss.render_design(selection=dm_render_args.selection,
                                  open_pins=dm_render_args.open_pins,
@@ -804,11 +846,8 @@ class Sweeping():
                                        setup_args, matrix_size, item,
                                        option_name)
             #Decide if need to clean the design.
-            obj_names = a_hfss.pinfo.get_all_object_names()
-            if obj_names:
-                if index == len_sweep and not leave_last_design:
-                    a_hfss.clean_active_design()
-                elif index != len_sweep:
+            if index != len_sweep or not leave_last_design:
+                if a_hfss.pinfo.get_all_object_names():
                     a_hfss.clean_active_design()
 
         a_hfss.disconnect_ansys()
@@ -998,10 +1037,12 @@ class Sweeping():
         # Assume both are lists or None since method:  eigenmodes()
         #                              in pyEPR returns a list or None.
         if len(freqs) == len(kappa_over_2pis):
-            quality_factor = [
-                float(ff) / float(kk) for ff, kk in zip(freqs, kappa_over_2pis)
-            ]
-            return quality_factor
+            # A kappa of zero gives inf rather than raising.
+            with np.errstate(divide='ignore', invalid='ignore'):
+                quality_factor = np.divide(
+                    np.asarray(freqs, dtype=np.float64),
+                    np.asarray(kappa_over_2pis, dtype=np.float64))
+            return quality_factor.tolist()
 
         self.design.logger.warning(
             'The Quality factor not calculated since size of freqs'
@@ -1076,18 +1117,19 @@ class Sweeping():
                                        'please look at warning messages.')
             return all_sweep, 8
 
+        # Results are keyed by item, so a repeated value would be rendered
+        # and analyzed again only to overwrite the same entry.
+        option_sweep = list(dict.fromkeys(option_sweep))
         len_sweep = len(option_sweep) - 1
+        option_key = option_path[-1]
+        rebuild_qcomps = self.components_to_rebuild(qcomp_name)
 
         # Last item in list.
         for index, item in enumerate(option_sweep):
-            if option_path[-1] in a_value.keys():
-                a_value[option_path[-1]] = item
-            else:
-                self.design.logger.warning(
-                    f'Key="{option_path[-1]}" is not in dict.')
-                return all_sweep, 5
+            a_value[option_key] = item
 
-            self.design.rebuild()
+            for qcomp in rebuild_qcomps:
+                qcomp.rebuild()
 
             a_q3d.render_design(
                 selection=qcomp_render,
@@ -1096,11 +1138,8 @@ class Sweeping():
             self.populate_q3d_all_sweep(all_sweep, a_q3d, item, option_name)
 
             #Decide if need to clean the design.
-            obj_names = a_q3d.pinfo.get_all_object_names()
-            if obj_names:
-                if index == len_sweep and not leave_last_design:
-                    a_q3d.clean_active_design()
-                elif index != len_sweep:
+            if index != len_sweep or not leave_last_design:
+                if a_q3d.pinfo.get_all_object_names():
                     a_q3d.clean_active_design()
 
         a_q3d.disconnect_ansys()
@@ -1121,11 +1160,12 @@ class Sweeping():
         """
 
         #Analyze said solution setup.
-        a_q3d.analyze_setup(a_q3d.pinfo.setup.name)
+        setup = a_q3d.pinfo.setup
+        a_q3d.analyze_setup(setup.name)
 
         # If 'LastAdaptive' is used, then the pass_number won't affect anything.
         # If 'AdaptivePass' is used, then the pass_number is used.
-        convergence_df, convergence_txt = a_q3d.pinfo.setup.get_convergence()
+        convergence_df, convergence_txt = setup.get_convergence()
         target, current, pass_min = self._parse_text_from_q3d_convergence(
             convergence_txt)
         is_converged = self._test_if_q3d_analysis_converged(
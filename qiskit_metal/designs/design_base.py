@@ -17,7 +17,8 @@ import importlib
 #import inspect
 #import os
 from datetime import datetime
-from typing import Any, Dict as Dict_, Iterable, List, TYPE_CHECKING, Union
+from typing import (Any, Dict as Dict_, Iterable, List, Sequence,
+                    TYPE_CHECKING, Union)
 
 import pandas as pd
 
@@ -813,15 +814,17 @@ class QDesign():
         """
         return parse_value(value, self.variables)
 
-    def parse_options(self, params: dict, param_names: str) -> dict:
+    def parse_options(self, params: dict,
+                      param_names: Union[str, Sequence[str]]) -> dict:
         """Extra utility function that can call parse_value on individual
         options. Use self.parse_value to parse only some options from a params
         dictionary.
 
         Args:
             params (dict): Input dict to pull form
-            param_names (str): Keys of dictionary to parse and return as a dictionary.
-                               Example value: 'x,y,z,cpw_width'
+            param_names (Union[str, Sequence[str]]): Keys of dictionary to parse and return as a dictionary.
+                               Example value: 'x,y,z,cpw_width' or
+                               ('x', 'y', 'z', 'cpw_width')
 
         Returns:
             dict: Dictionary of the keys contained in `param_names` with values that are parsed.
@@ -355,8 +355,12 @@ def to_vec3D(list_of_2d_pts: List[Tuple], z=0) -> np.ndarray:
     Returns:
         np.ndarray: vec3d of points
     """
-    add_me = [z]
-    return np.array([list(a_2d_pt) + add_me for a_2d_pt in list_of_2d_pts])
+    points = np.asarray(list_of_2d_pts, dtype=float)
+    if points.ndim != 2:
+        # Empty or ragged input; keep the point by point behavior
+        add_me = [z]
+        return np.array([list(a_2d_pt) + add_me for a_2d_pt in list_of_2d_pts])
+    return np.hstack((points, np.full((len(points), 1), z, dtype=float)))
 
 
 Vec2D = Union[list, np.ndarray]
@@ -189,8 +189,7 @@ class QComponent():
                 'parent of this QComponent.")
 
         self._design = design  # reference to parent
-        # pylint: disable=literal-comparison
-        if self._delete_evaluation(name) is 'NameInUse':
+        if self._delete_evaluation(name) == 'NameInUse':
             raise ValueError(
                 f"{name} already exists! Please choose a different name for your new QComponent"
             )
@@ -1106,7 +1105,9 @@ name='{strname}'{other_args}
                 renderer_key_values[key] = deepcopy(self.options[key])
 
         # # if not already in kwargs, add renderer information to it.
-        renderer_and_options = {**renderer_key_values, **kwargs}
+        # renderer_key_values is freshly built per call, so merge kwargs into
+        # it rather than allocating yet another dict on every make().
+        renderer_key_values.update(kwargs)
 
         # When self.options is instantiated, the template_options are populated.
         # renderer_and_options = {**self.options, **kwargs}
@@ -1118,7 +1119,7 @@ name='{strname}'{other_args}
                                             helper=helper,
                                             layer=layer,
                                             chip=chip,
-                                            **renderer_and_options)
+                                            **renderer_key_values)
 
     def _get_specific_table_values_from_renderers(self, kind: str) -> Dict:
         """Populate a dict to combine with options for the qcomponent.
@@ -249,14 +249,14 @@ class QRoute(QComponent):
                             "\" is not supported for this CPW." +
                             " The only supported pins are: start, end.")
 
-        # grab the reference component pin
-        reference_pin = self._get_connected_pin(options_pin)
+        # grab the reference component and its pin (look up the name only once)
+        reference_component = self.design.components[options_pin.component]
+        reference_pin = reference_component.pins[options_pin.pin]
 
         # create the cpw pin and document the connections to the reference_pin in the netlist
         self.add_pin(name, reference_pin.points[::-1], self.p.trace_width)
-        self.design.connect_pins(
-            self.design.components[options_pin.component].id, options_pin.pin,
-            self.id, name)
+        self.design.connect_pins(reference_component.id, options_pin.pin,
+                                 self.id, name)
 
         # anchor the correct lead to the pin and return its position and direction
         return lead.seed_from_pin(reference_pin)
@@ -535,8 +535,7 @@ class QRoute(QComponent):
         points = self.get_points()
 
         # get the length without the corner rounding radius adjustment
-        length_estimate = sum(
-            norm(points[i + 1] - points[i]) for i in range(len(points) - 1))
+        length_estimate = norm(np.diff(points, axis=0), axis=1).sum()
         # compensate for corner rounding
         length_estimate -= self.length_excess_corner_rounding(points)
 
@@ -597,11 +596,13 @@ class QRoute(QComponent):
         # prepare the routing track
         line = draw.LineString(pts)
 
-        # compute actual final length
+        # compute actual final length, straight from the points rather than
+        # reading the coordinates back out of the shapely geometry
         p = self.p
+        actual_length = norm(np.diff(pts, axis=0), axis=1).sum()
+        actual_length -= self.length_excess_corner_rounding(pts)
         self.options._actual_length = str(
-            line.length - self.length_excess_corner_rounding(line.coords)
-        ) + ' ' + self.design.get_units()
+            actual_length) + ' ' + self.design.get_units()
 
         # expand the routing track to form the substrate core of the cpw
         self.add_qgeometry('path', {'trace': line},
@@ -728,9 +729,7 @@ class QRouteLead:
         Return:
             length (float): Full point_array length
         """
-        return sum(
-            norm(self.pts[i + 1] - self.pts[i])
-            for i in range(len(self.pts) - 1))
+        return norm(np.diff(self.pts, axis=0), axis=1).sum()
 
     def get_tip(self) -> QRoutePoint:
         """Access the last element in the QRouteLead.
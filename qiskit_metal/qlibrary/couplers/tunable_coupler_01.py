@@ -129,7 +129,11 @@ class TunableCoupler01(BaseQubit):
                                         origin=(0, 0))
         ])
 
-        cap_subtract = cap_island.buffer(p.l_gap, cap_style=3, join_style=2)
+        # mitred joins and square caps have no arcs, so one segment suffices
+        cap_subtract = cap_island.buffer(p.l_gap,
+                                         resolution=1,
+                                         cap_style=3,
+                                         join_style=2)
 
         #Reference coordinates
         cpl_x = 1 / 5 * x_spot
@@ -165,7 +169,10 @@ class TunableCoupler01(BaseQubit):
         con_body = draw.shapely.ops.cascaded_union(
             [con_pad, con_arm_l, con_arm_r])
 
-        con_sub = con_body.buffer(p.cp_gap, cap_style=3, join_style=2)
+        con_sub = con_body.buffer(p.cp_gap,
+                                  resolution=1,
+                                  cap_style=3,
+                                  join_style=2)
 
         con_pin = draw.LineString([[cpl_x, cpl_y], [cpl_x,
                                                     cpl_y + p.cp_height]])
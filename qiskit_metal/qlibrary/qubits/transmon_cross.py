@@ -121,9 +121,21 @@ class TransmonCross(BaseQubit):  # pylint: disable=invalid-name
             draw.LineString([(0, cross_length), (0, -cross_length)]),
             draw.LineString([(cross_length, 0), (-cross_length, 0)])
         ])
+        # The etch is buffered from lines longer by cross_gap at each end,
+        # which gives the same outline as buffering the cross again,
+        # without buffering the polygon of the cross.
+        etch_length = cross_length + cross_gap
+        etch_line = draw.shapely.ops.cascaded_union([
+            draw.LineString([(0, etch_length), (0, -etch_length)]),
+            draw.LineString([(etch_length, 0), (-etch_length, 0)])
+        ])
 
         cross = cross_line.buffer(cross_width / 2, cap_style=2)
-        cross_etch = cross.buffer(cross_gap, cap_style=3, join_style=2)
+        # flat caps and mitred joins have no arcs, so one segment suffices
+        cross_etch = etch_line.buffer(cross_width / 2 + cross_gap,
+                                      resolution=1,
+                                      cap_style=2,
+                                      join_style=2)
 
         # The junction/SQUID
         #rect_jj = draw.rectangle(cross_width, cross_gap)
@@ -13,9 +13,12 @@
 # that they have been altered from the originals.
 """Anchored path."""
 
+from typing import Tuple
+
 import numpy as np
 
 from collections import OrderedDict
+from contextlib import contextmanager
 from qiskit_metal import Dict
 from qiskit_metal.qlibrary.core import QRoute, QRoutePoint
 from qiskit_metal.toolbox_metal import math_and_overrides as mao
@@ -135,6 +138,10 @@ class RouteAnchors(QRoute):
 
     TOOLTIP = """Creates and connects a series of anchors through which the Route passes."""
 
+    _obstacles = None
+    """Bounds of the other components, see _cached_obstacles(). False while
+    caching but not needed yet."""
+
     from shapely.ops import cascaded_union
     from matplotlib import pyplot as plt
     import geopandas as gpd
@@ -171,6 +178,35 @@ class RouteAnchors(QRoute):
         # All clear, no intersections
         return True
 
+    def _get_obstacles(self) -> Tuple[list, np.ndarray]:
+        """Collect the bounding boxes of all the other components in the
+        design.
+
+        Returns:
+            tuple: List of component names, and array of their
+            (minx, miny, maxx, maxy) bounds, one row per name
+        """
+        names = [
+            component for component in self.design.components
+            if component != self.name
+        ]
+        bounds = [
+            self.design.components[component].qgeometry_bounds()
+            for component in names
+        ]
+        return names, np.array(bounds, dtype=float).reshape(-1, 4)
+
+    @contextmanager
+    def _cached_obstacles(self):
+        """Share the bounds of the other components among all the collision
+        checks made within the context; they do not move while this route is
+        made."""
+        self._obstacles = False
+        try:
+            yield
+        finally:
+            self._obstacles = None
+
     def unobstructed(self, segment: list) -> bool:
         """Check that no component's bounding box in self.design intersects or
         overlaps a given segment.
@@ -182,12 +218,24 @@ class RouteAnchors(QRoute):
             bool: True is no obstacles
         """
 
+        names, bounds = self._obstacles or self._get_obstacles()
+        if self._obstacles is False:
+            # Within _cached_obstacles(): reuse them for the next segments
+            self._obstacles = (names, bounds)
+
+        # Only components whose bounding box overlaps that of the segment can
+        # block it, so skip the edge tests for all the others
+        seg_min = np.minimum(segment[0], segment[1])
+        seg_max = np.maximum(segment[0], segment[1])
+        candidates = np.flatnonzero((bounds[:, 0] <= seg_max[0]) &
+                                    (bounds[:, 1] <= seg_max[1]) &
+                                    (bounds[:, 2] >= seg_min[0]) &
+                                    (bounds[:, 3] >= seg_min[1]))
+
         # assumes rectangular bounding boxes
-        for component in self.design.components:
-            if component == self.name:
-                continue
-            xmin, ymin, xmax, ymax = self.design.components[
-                component].qgeometry_bounds()
+        for index in candidates:
+            component = names[index]
+            xmin, ymin, xmax, ymax = bounds[index]
             # p, q, r, s are corner coordinates of each bounding box
             p, q, r, s = [
                 np.array([xmin, ymin]),
@@ -220,7 +268,8 @@ class RouteAnchors(QRoute):
         Raises:
             QiskitMetalDesignError: If the connect_simple() has failed.
         """
-        avoid_collision = self.parse_options().advanced.avoid_collision
+        avoid_collision = self.parse_value(
+            self.options.advanced.avoid_collision)
 
         start_direction = start_pt.direction
         start = start_pt.position
@@ -388,14 +437,16 @@ class RouteAnchors(QRoute):
         end_point = self.set_lead("end")
 
         self.intermediate_pts = OrderedDict()
-        for arc_num, coord in anchors.items():
-            arc_pts = self.connect_simple(self.get_tip(), QRoutePoint(coord))
-            if arc_pts is None:
-                self.intermediate_pts[arc_num] = [coord]
-            else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
-        arc_pts = self.connect_simple(self.get_tip(), end_point)
+        with self._cached_obstacles():
+            for arc_num, coord in anchors.items():
+                arc_pts = self.connect_simple(self.get_tip(),
+                                              QRoutePoint(coord))
+                if arc_pts is None:
+                    self.intermediate_pts[arc_num] = [coord]
+                else:
+                    self.intermediate_pts[arc_num] = np.concatenate(
+                        [arc_pts, [coord]], axis=0)
+            arc_pts = self.connect_simple(self.get_tip(), end_point)
         if arc_pts is not None:
             self.intermediate_pts[len(anchors)] = np.array(arc_pts)
 
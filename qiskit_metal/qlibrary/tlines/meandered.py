@@ -152,6 +152,16 @@ class RouteMeander(QRoute):
             length_direct = norm(dist)
             length_sideways = 0
 
+        # Leads facing each other on a common axis, with no length to spare:
+        # the straight segment between them is the whole route
+        if (asymmetry == 0 and
+                mao.round(mao.dot(start_pt.direction, end_pt.direction)) == -1
+                and mao.round(mao.dot(start_pt.direction, dist)) == mao.round(
+                    norm(dist)) and
+                mao.round(length_meander - length_direct) <= 0):
+            self.logger.info(f'Straight route for {self.name}')
+            return np.empty((0, 2), float)
+
         # Breakup into sections
         meander_number = np.floor(length_direct / spacing)
         if meander_number < 1:
@@ -196,12 +206,10 @@ class RouteMeander(QRoute):
         length_perp = max(0, length_excess / (meander_number * 2.))
 
         # USES ROW Vectors
-        # const vec. of unit normals
-        middle_points = [forward] * int(meander_number + 1)
         # index so to multiply other column - creates a column vector
         scale_bys = spacing * np.arange(int(meander_number + 1))[:, None]
-        # multiply each one in a linear chain fashion fwd
-        middle_points = scale_bys * middle_points
+        # multiply the unit forward vector in a linear chain fashion fwd
+        middle_points = scale_bys * forward
         '''
         middle_points = array([
             [0. , 0. ],
@@ -218,12 +226,11 @@ class RouteMeander(QRoute):
         # root_pts = np.concatenate([middle_points,
         #                            end.position[None, :]],  # convert to row vectors
         #                           axis=0)
-        side_shift_vecs = np.array([sideways * length_perp] *
-                                   len(middle_points))
-        asymmetry_vecs = np.array([sideways * asymmetry] * len(middle_points))
-        root_pts = middle_points + asymmetry_vecs
-        top_pts = root_pts + side_shift_vecs
-        bot_pts = root_pts - side_shift_vecs
+        # broadcast the constant sideways shifts over all the rows
+        side_shift_vec = sideways * length_perp
+        root_pts = middle_points + sideways * asymmetry
+        top_pts = root_pts + side_shift_vec
+        bot_pts = root_pts - side_shift_vec
 
         ################################################################
         # Combine points
@@ -126,23 +126,24 @@ class RouteMixed(RoutePathfinder, RouteMeander):
         # at first, store points "per segment" in a dictionary, so it is easier to apply length requirements
         self.intermediate_pts = OrderedDict()
         meanders = set()
-        for arc_num, coord in anchors.items():
-            # determine what is the connection strategy for this pair, based on user inputs
-            connect_method = self.select_connect_method(arc_num)
+        with self._cached_obstacles():
+            for arc_num, coord in anchors.items():
+                # determine what is the connection strategy for this pair, based on user inputs
+                connect_method = self.select_connect_method(arc_num)
+                if connect_method == self.connect_meandered:
+                    meanders.add(arc_num)
+                # compute points connecting the anchors, all but the last
+                arc_pts = connect_method(self.get_tip(), QRoutePoint(coord))
+                if arc_pts is None:
+                    self.intermediate_pts[arc_num] = [coord]
+                else:
+                    self.intermediate_pts[arc_num] = np.concatenate(
+                        [arc_pts, [coord]], axis=0)
+            # compute last connection point to the output QRouteLead
+            connect_method = self.select_connect_method(len(anchors))
             if connect_method == self.connect_meandered:
-                meanders.add(arc_num)
-            # compute points connecting the anchors, all but the last
-            arc_pts = connect_method(self.get_tip(), QRoutePoint(coord))
-            if arc_pts is None:
-                self.intermediate_pts[arc_num] = [coord]
-            else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
-        # compute last connection point to the output QRouteLead
-        connect_method = self.select_connect_method(len(anchors))
-        if connect_method == self.connect_meandered:
-            meanders.add(len(anchors))
-        arc_pts = connect_method(self.get_tip(), end_point)
+                meanders.add(len(anchors))
+            arc_pts = connect_method(self.get_tip(), end_point)
         if arc_pts is not None:
             self.intermediate_pts[len(anchors)] = np.array(arc_pts)
 
@@ -69,7 +69,7 @@ class RoutePathfinder(RouteAnchors):
         end_direction = end_pt.direction
         end = end_pt.position
 
-        step_size = self.parse_options().step_size
+        step_size = self.parse_value(self.options.step_size)
 
         starting_dist = sum(
             abs(end - start))  # Manhattan distance between start and end
@@ -169,15 +169,16 @@ class RoutePathfinder(RouteAnchors):
         end_point = self.set_lead("end")
 
         self.intermediate_pts = OrderedDict()
-        for arc_num, coord in anchors.items():
-            arc_pts = self.connect_astar_or_simple(self.get_tip(),
-                                                   QRoutePoint(coord))
-            if arc_pts is None:
-                self.intermediate_pts[arc_num] = [coord]
-            else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
-        arc_pts = self.connect_astar_or_simple(self.get_tip(), end_point)
+        with self._cached_obstacles():
+            for arc_num, coord in anchors.items():
+                arc_pts = self.connect_astar_or_simple(self.get_tip(),
+                                                       QRoutePoint(coord))
+                if arc_pts is None:
+                    self.intermediate_pts[arc_num] = [coord]
+                else:
+                    self.intermediate_pts[arc_num] = np.concatenate(
+                        [arc_pts, [coord]], axis=0)
+            arc_pts = self.connect_astar_or_simple(self.get_tip(), end_point)
         if arc_pts is not None:
             self.intermediate_pts[len(anchors)] = np.array(arc_pts)
 
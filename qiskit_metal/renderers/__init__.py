@@ -92,3 +92,44 @@ if config.is_building_docs():
     from .renderer_ansys.ansys_renderer import QAnsysRenderer
     from .renderer_ansys.hfss_renderer import QHFSSRenderer
     from .renderer_ansys.q3d_renderer import QQ3DRenderer
+else:
+    # Import the renderers on first access only, since they pull in slow
+    # third-party packages (matplotlib, gdspy, pyEPR).
+    import importlib
+
+    _LAZY_IMPORTS = {
+        'QRenderer': 'renderer_base.renderer_base',
+        'QRendererGui': 'renderer_base.renderer_gui_base',
+        'QRendererAnalysis': 'renderer_base.rndr_analysis',
+        'QGDSRenderer': 'renderer_gds.gds_renderer',
+        'Cheesing': 'renderer_gds.make_cheese',
+        'PlotCanvas': 'renderer_mpl.mpl_canvas',
+        'MplInteraction': 'renderer_mpl.mpl_interaction',
+        'ZoomOnWheel': 'renderer_mpl.mpl_interaction',
+        'PanAndZoom': 'renderer_mpl.mpl_interaction',
+        'QMplRenderer': 'renderer_mpl.mpl_renderer',
+        'AnimatedText': 'renderer_mpl.extensions.animated_text',
+        'QAnsysRenderer': 'renderer_ansys.ansys_renderer',
+        'QHFSSRenderer': 'renderer_ansys.hfss_renderer',
+        'QQ3DRenderer': 'renderer_ansys.q3d_renderer',
+    }
+
+    def __getattr__(name: str):
+        """Import a renderer class the first time it is accessed.
+
+        Args:
+            name (str): Name of the attribute being looked up
+
+        Returns:
+            type: The requested renderer class
+
+        Raises:
+            AttributeError: The name is not a renderer of this package
+        """
+        if name not in _LAZY_IMPORTS:
+            raise AttributeError(
+                f'module {__name__!r} has no attribute {name!r}')
+        module = importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
@@ -15,6 +15,7 @@
 
 from typing import List, Tuple, Union
 
+from functools import lru_cache
 import re
 import os
 from pathlib import Path
@@ -70,6 +71,11 @@ def good_fillet_idxs(coords: list,
         len(coords))[1:-1]
 
 
+# Leading characters that cannot start a name, or invalid characters anywhere
+_UNCLEAN_NAME_RE = re.compile('^[^a-zA-Z_]+|[^0-9a-zA-Z_]')
+
+
+@lru_cache(maxsize=1024)
 def get_clean_name(name: str) -> str:
     """Create a valid variable name from the given one by removing having it
     begin with a letter or underscore followed by an unlimited string of
@@ -81,11 +87,10 @@ def get_clean_name(name: str) -> str:
     Returns:
         str: Variable name consistent with Python naming conventions.
     """
-    # Remove invalid characters
-    name = re.sub('[^0-9a-zA-Z_]', '', name)
-    # Remove leading characters until we find a letter or underscore
-    name = re.sub('^[^a-zA-Z_]+', '', name)
-    return name
+    # The leading run of characters that are not letters or underscores is
+    # made only of invalid characters and digits, so dropping it together
+    # with the invalid characters elsewhere is done in a single pass.
+    return _UNCLEAN_NAME_RE.sub('', name)
 
 
 class QAnsysRenderer(QRendererAnalysis):
@@ -153,6 +158,14 @@ class QAnsysRenderer(QRendererAnalysis):
     name = 'ansys'
     """Name"""
 
+    _MISSING_IN_ANSYS = dict(
+        pinfo=('Have you run connect_ansys()?  '
+               'Cannot find a reference to Ansys in QRenderer.'),
+        project='Project not found, have you opened a project?',
+        design=('Design not found in selected project, '
+                'have you opened a design?'))
+    """Warning for each missing piece of the Ansys connection."""
+
     default_setup = Dict(
         drivenmodal=Dict(name="Setup",
                          freq_ghz='5.0',
@@ -231,6 +244,11 @@ class QAnsysRenderer(QRendererAnalysis):
         self._rapp = None
         self._rdesktop = None
 
+        # Filled by render_design(), emptied again at the start of each render
+        self.chip_subtract_dict = defaultdict(set)
+        self.assign_perfE = []
+        self.assign_mesh = []
+
     @property
     def initialized(self):
         """Returns True if initialized, False otherwise."""
@@ -457,6 +475,53 @@ class QAnsysRenderer(QRendererAnalysis):
         """Project info for Ansys renderer (class: pyEPR.ProjectInfo)."""
         return self._pinfo
 
+    def _warn_missing(self, missing: str, not_done: str = ''):
+        """Warn that a piece of the Ansys connection is missing.
+
+        Args:
+            missing (str): Key of _MISSING_IN_ANSYS: 'pinfo', 'project'
+                or 'design'.
+            not_done (str): What was skipped because of it, appended to the
+                warning. Defaults to ''.
+        """
+        self.logger.warning(
+            f'{self._MISSING_IN_ANSYS[missing]} {not_done}'.rstrip())
+
+    def _get_active_project(self, not_done: str = ''):
+        """Get the project active in Ansys, or warn about why there is none.
+
+        Args:
+            not_done (str): What was skipped for lack of a project, appended
+                to the warning. Defaults to ''.
+
+        Returns:
+            pyEPR.ansys.HfssProject: The active project, or None.
+        """
+        if not self.pinfo:
+            self._warn_missing('pinfo', not_done)
+            return None
+        if not self.pinfo.project:
+            self._warn_missing('project', not_done)
+            return None
+        return self.pinfo.project
+
+    def _get_active_design(self, not_done: str = ''):
+        """Get the design active in Ansys, or warn about why there is none.
+
+        Args:
+            not_done (str): What was skipped for lack of a design, appended
+                to the warning. Defaults to ''.
+
+        Returns:
+            pyEPR.ansys.HfssDesign: The active design, or None.
+        """
+        if not self._get_active_project(not_done):
+            return None
+        if not self.pinfo.design:
+            self._warn_missing('design', not_done)
+            return None
+        return self.pinfo.design
+
     @property
     def modeler(self):
         """The modeler from pyEPR HfssModeler.
@@ -767,53 +832,46 @@ class QAnsysRenderer(QRendererAnalysis):
             name (str): Name of the new Ansys design
         """
 
-        if self.pinfo:
-            if self.pinfo.project:
-                try:
-                    names_in_design = self.pinfo.project.get_design_names()
-                except AttributeError:
-                    self.logger.error(
-                        'Please install a more recent version of pyEPR (>=0.8.4.5)'
-                    )
+        if not self._get_active_project():
+            return
 
-                if design_name in names_in_design:
-                    self.pinfo.connect_design(design_name)
-                    oDesktop = self.pinfo.design.parent.parent._desktop  # self.pinfo.design does not work
-                    oProject = oDesktop.SetActiveProject(
-                        self.pinfo.project_name)
-                    oDesign = oProject.SetActiveDesign(design_name)
-                    current_solution_type = self.pinfo.design.solution_type.lower(
-                    )
-                    if current_solution_type == 'q3d':
-                        current_solution_type = 'capacitive'
-                    if current_solution_type != solution_type and solution_type is not None:
-                        self.logger.warning(
-                            f'The design_name={design_name} already exists, but it has solution_type=='
-                            f'{current_solution_type}, which is different from the requested=={solution_type}. '
-                            f'If you want a design with solution type=={solution_type}, please change the name '
-                            'requested for your design to one that does not exist. Alternatively, manually modify '
-                            f'the solution_type for design {design_name} from the Ansys GUI.'
-                        )
-                else:
-                    self.logger.warning(
-                        f'The design_name={design_name} was not in active project.  '
-                        f'Designs in active project are: \n{names_in_design}.  '
-                        'A new design will be added to the project.  ')
-                    if solution_type is not None:
-                        adesign = self.new_ansys_design(
-                            design_name=design_name,
-                            solution_type=solution_type,
-                            connect=True)
-                    else:
-                        self.logger.error(
-                            'Please specify the solution_type, to determine what design to create'
-                        )
+        try:
+            names_in_design = self.pinfo.project.get_design_names()
+        except AttributeError:
+            self.logger.error(
+                'Please install a more recent version of pyEPR (>=0.8.4.5)')
+            return
+
+        if design_name not in names_in_design:
+            self.logger.warning(
+                f'The design_name={design_name} was not in active project.  '
+                f'Designs in active project are: \n{names_in_design}.  '
+                'A new design will be added to the project.  ')
+            if solution_type is not None:
+                self.new_ansys_design(design_name=design_name,
+                                      solution_type=solution_type,
+                                      connect=True)
             else:
-                self.logger.warning(
-                    "Project not found, have you opened a project?")
-        else:
+                self.logger.error(
+                    'Please specify the solution_type, to determine what design to create'
+                )
+            return
+
+        self.pinfo.connect_design(design_name)
+        # self.pinfo.design does not work
+        o_desktop = self.pinfo.design.parent.parent._desktop
+        o_project = o_desktop.SetActiveProject(self.pinfo.project_name)
+        o_project.SetActiveDesign(design_name)
+        current_solution_type = self.pinfo.design.solution_type.lower()
+        if current_solution_type == 'q3d':
+            current_solution_type = 'capacitive'
+        if current_solution_type != solution_type and solution_type is not None:
             self.logger.warning(
-                "Have you run start()?  Cannot find a reference to Ansys in QRenderer."
+                f'The design_name={design_name} already exists, but it has solution_type=='
+                f'{current_solution_type}, which is different from the requested=={solution_type}. '
+                f'If you want a design with solution type=={solution_type}, please change the name '
+                'requested for your design to one that does not exist. Alternatively, manually modify '
+                f'the solution_type for design {design_name} from the Ansys GUI.'
             )
 
     def new_ansys_setup(self, name: str, **other_setup):
@@ -894,38 +952,27 @@ class QAnsysRenderer(QRendererAnalysis):
               If name for setup does not exist, create a new setup with the name.
               If name is None, create a new setup with default name.
         """
-        if self.pinfo:
-            if self.pinfo.project:
-                if self.pinfo.design:
-                    # look for setup name, if not there, then add a new one
-                    if setup_name:
-                        all_setup_names = self.pinfo.design.get_setup_names()
-                        self.pinfo.setup_name = setup_name
-                        if setup_name in all_setup_names:
-                            # When name is given and in design. So have pinfo reference existing setup.
-                            self.pinfo.setup = self.pinfo.get_setup(setup_name)
-                        else:
-                            # When name is given, but not in design. So make a new setup with given name.
-                            self.logger.warning(
-                                f'The setup_name={setup_name} was not in active design.  '
-                                f'Setups in active design are: \n{all_setup_names}.  '
-                                'A new setup will default values will be added to the design.  '
-                            )
-                            self.pinfo.setup = self.new_ansys_setup(
-                                name=setup_name)
-                    else:
-                        self.logger.warning(f'Please specify a setup_name.')
-                else:
-                    self.logger.warning(
-                        "Design not found in selected project, have you opened a design?"
-                    )
+        design = self._get_active_design()
+        if not design:
+            return
+
+        # look for setup name, if not there, then add a new one
+        if setup_name:
+            all_setup_names = design.get_setup_names()
+            self.pinfo.setup_name = setup_name
+            if setup_name in all_setup_names:
+                # When name is given and in design. So have pinfo reference existing setup.
+                self.pinfo.setup = self.pinfo.get_setup(setup_name)
             else:
+                # When name is given, but not in design. So make a new setup with given name.
                 self.logger.warning(
-                    "Project not found, have you opened a project?")
+                    f'The setup_name={setup_name} was not in active design.  '
+                    f'Setups in active design are: \n{all_setup_names}.  '
+                    'A new setup will default values will be added to the design.  '
+                )
+                self.pinfo.setup = self.new_ansys_setup(name=setup_name)
         else:
-            self.logger.warning(
-                "Have you run connect_ansys()?  Cannot find a reference to Ansys in QRenderer."
-            )
+            self.logger.warning(f'Please specify a setup_name.')
 
     def render_design(self,
                       selection: Union[list, None] = None,
@@ -977,9 +1024,9 @@ class QAnsysRenderer(QRendererAnalysis):
                 'Unable to proceed with rendering. Please check selection.')
             return
 
-        self.chip_subtract_dict = defaultdict(set)
-        self.assign_perfE = []
-        self.assign_mesh = []
+        self.chip_subtract_dict.clear()
+        self.assign_perfE.clear()
+        self.assign_mesh.clear()
 
         self.render_tables()
         self.add_endcaps(open_pins)
@@ -998,9 +1045,11 @@ class QAnsysRenderer(QRendererAnalysis):
         """
         Render components in design grouped by table type (path, poly, or junction).
         """
-        for table_type in self.design.qgeometry.get_element_types():
-            if table_type != 'junction' or not skip_junction:
-                self.render_components(table_type)
+        table_types = self.design.qgeometry.get_element_types()
+        if skip_junction:
+            table_types = [t for t in table_types if t != 'junction']
+        for table_type in table_types:
+            self.render_components(table_type)
 
     def render_components(self, table_type: str):
         """
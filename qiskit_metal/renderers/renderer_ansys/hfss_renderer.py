@@ -12,7 +12,6 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-from collections import defaultdict
 from pathlib import Path
 from typing import Union, Tuple
 
@@ -66,6 +65,8 @@ class QHFSSRenderer(QAnsysRenderer):
         super().__init__(design=design, initiate=initiate, options=options)
 
         self.current_sweep = None
+        # The eigenmode setup and its solutions, from get_eigenmodes.
+        self._eigenmode_solutions = (None, None)
 
         QHFSSRenderer.load()
 
@@ -159,9 +160,9 @@ class QHFSSRenderer(QAnsysRenderer):
                 'Unable to proceed with rendering. Please check selection.')
             return
 
-        self.chip_subtract_dict = defaultdict(set)
-        self.assign_perfE = []
-        self.assign_mesh = []
+        self.chip_subtract_dict.clear()
+        self.assign_perfE.clear()
+        self.assign_mesh.clear()
         self.jj_lumped_ports = {}
         self.jj_to_ignore = set()
 
@@ -585,96 +586,83 @@ class QHFSSRenderer(QAnsysRenderer):
             * min_converged (int, optional): Minimum number of converged passes. Defaults to 1.
         """
 
-        if self.pinfo:
-            if self.pinfo.project:
-                if self.pinfo.design:
-                    if self.pinfo.design.solution_type == 'Eigenmode':
-                        if self.pinfo.setup_name != setup_args.name:
-                            self.design.logger.warning(
-                                f'The name of active setup={self.pinfo.setup_name} does not match'
-                                f'the name of of setup_args.name={setup_args.name}. '
-                                f'To use this method, activate the desired Setup before editing it. The '
-                                f'setup_args was not used to update the active Setup.'
-                            )
-                            return
-
-                        for key, value in setup_args.items():
-                            if key == "name":
-                                continue  #Checked for above.
-                            if key == "n_modes":
-                                #EditSetup  not documented, this is just attempt to use.
-                                #args_editsetup = ["NAME:" + setup_args.name,["NumModes:=", setup_args.n_modes]]
-                                #self.pinfo.setup._setup_module.EditSetup([setup_args.name, args_editsetup])
-                                if value < 0 or value > 20 or not isinstance(
-                                        value, int):
-                                    self.logger.warning(
-                                        f'Value of n_modes={value} must be integer from 1 to 20.'
-                                    )
-                                else:
-                                    self.pinfo.setup.n_modes = value
-                                    continue
-                            if key == "min_freq_ghz":
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for min_freq_ghz should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.min_freq = f'{value}GHz'
-                                    continue
-                            if key == 'max_delta_f':
-                                if not isinstance(value, float):
-                                    self.logger.warning(
-                                        'The value for max_delta_f should be float. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.delta_f = value
-                                    continue
-                            if key == 'max_passes':
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for max_passes should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.passes = value
-                                    continue
-                            if key == 'pct_refinement':
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for pct_refinement should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.pct_refinement = value
-                                    continue
-                            if key == 'basis_order':
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for basis_order should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.basis_order = value
-                                    continue
-
-                            self.design.logger.warning(
-                                f'In setup_args, key={key}, value={value} is not in pinfo.setup, '
-                                'the key/value pair from setup_args not added to Setup in Ansys.'
-                            )
+        design = self._get_active_design('Setup not updated.')
+        if not design:
+            return
 
-                    else:
+        if design.solution_type == 'Eigenmode':
+            if self.pinfo.setup_name != setup_args.name:
+                self.design.logger.warning(
+                    f'The name of active setup={self.pinfo.setup_name} does not match'
+                    f'the name of of setup_args.name={setup_args.name}. '
+                    f'To use this method, activate the desired Setup before editing it. The '
+                    f'setup_args was not used to update the active Setup.'
+                )
+                return
+
+            for key, value in setup_args.items():
+                if key == "name":
+                    continue  #Checked for above.
+                if key == "n_modes":
+                    #EditSetup  not documented, this is just attempt to use.
+                    #args_editsetup = ["NAME:" + setup_args.name,["NumModes:=", setup_args.n_modes]]
+                    #self.pinfo.setup._setup_module.EditSetup([setup_args.name, args_editsetup])
+                    if value < 0 or value > 20 or not isinstance(value, int):
                         self.logger.warning(
-                            'The design does not have solution type as "Eigenmode". The Setup not updated.'
+                            f'Value of n_modes={value} must be integer from 1 to 20.'
                         )
-                else:
-                    self.logger.warning(
-                        'A design is not in active project. The Setup not updated.'
-                    )
-            else:
-                self.logger.warning(
-                    "Project not available, have you opened a project? Setup not updated."
+                    else:
+                        self.pinfo.setup.n_modes = value
+                        continue
+                if key == "min_freq_ghz":
+                    if not isinstance(value, int):
+                        self.logger.warning(
+                            'The value for min_freq_ghz should be an int. '
+                            f'The present value is {value}.')
+                    else:
+                        self.pinfo.setup.min_freq = f'{value}GHz'
+                        continue
+                if key == 'max_delta_f':
+                    if not isinstance(value, float):
+                        self.logger.warning(
+                            'The value for max_delta_f should be float. '
+                            f'The present value is {value}.')
+                    else:
+                        self.pinfo.setup.delta_f = value
+                        continue
+                if key == 'max_passes':
+                    if not isinstance(value, int):
+                        self.logger.warning(
+                            'The value for max_passes should be an int. '
+                            f'The present value is {value}.')
+                    else:
+                        self.pinfo.setup.passes = value
+                        continue
+                if key == 'pct_refinement':
+                    if not isinstance(value, int):
+                        self.logger.warning(
+                            'The value for pct_refinement should be an int. '
+                            f'The present value is {value}.')
+                    else:
+                        self.pinfo.setup.pct_refinement = value
+                        continue
+                if key == 'basis_order':
+                    if not isinstance(value, int):
+                        self.logger.warning(
+                            'The value for basis_order should be an int. '
+                            f'The present value is {value}.')
+                    else:
+                        self.pinfo.setup.basis_order = value
+                        continue
+
+                self.design.logger.warning(
+                    f'In setup_args, key={key}, value={value} is not in pinfo.setup, '
+                    'the key/value pair from setup_args not added to Setup in Ansys.'
                 )
+
         else:
             self.logger.warning(
-                "Have you run connect_ansys()?  "
-                "Cannot find a reference to Ansys in QRenderer. Setup not updated. "
+                'The design does not have solution type as "Eigenmode". The Setup not updated.'
             )
 
     def edit_drivenmodal_setup(self, setup_args: Dict):
@@ -698,76 +686,64 @@ class QHFSSRenderer(QAnsysRenderer):
             * min_converged (int, optional): Minimum number of converged passes. Defaults to 1.
         """
 
-        if self.pinfo:
-            if self.pinfo.project:
-                if self.pinfo.design:
-                    if self.pinfo.design.solution_type == 'DrivenModal':
-                        if self.pinfo.setup_name != setup_args.name:
-                            self.design.logger.warning(
-                                f'The name of active setup={self.pinfo.setup_name} does not match'
-                                f'the name of of setup_args.name={setup_args.name}. '
-                                f'To use this method, activate the desired Setup before editing it. The '
-                                f'setup_args was not used to update the active Setup.'
-                            )
-                            return
-
-                        for key, value in setup_args.items():
-                            if key == "name":
-                                continue  #Checked for above.
-                            if key == "freq_ghz":
-                                if not isinstance(value, float):
-                                    self.logger.warning(
-                                        'The value for freq_ghz should be an float. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.solution_freq = f'{value}GHz'
-                                    continue
-                            if key == 'max_passes':
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for passes should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.passes = value
-                                    continue
-                            if key == 'pct_refinement':
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for pct_refinement should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.pct_refinement = value
-                                    continue
-                            if key == 'basis_order':
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for basis_order should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.basis_order = value
-                                    continue
-
-                            self.design.logger.warning(
-                                f'In setup_args, key={key}, value={value} is not in pinfo.setup, '
-                                'the key/value pair from setup_args not added to Setup in Ansys.'
-                            )
+        design = self._get_active_design('Setup not updated.')
+        if not design:
+            return
 
+        if design.solution_type == 'DrivenModal':
+            if self.pinfo.setup_name != setup_args.name:
+                self.design.logger.warning(
+                    f'The name of active setup={self.pinfo.setup_name} does not match'
+                    f'the name of of setup_args.name={setup_args.name}. '
+                    f'To use this method, activate the desired Setup before editing it. The '
+                    f'setup_args was not used to update the active Setup.'
+                )
+                return
+
+            for key, value in setup_args.items():
+                if key == "name":
+                    continue  #Checked for above.
+                if key == "freq_ghz":
+                    if not isinstance(value, float):
+                        self.logger.warning(
+                            'The value for freq_ghz should be an float. '
+                            f'The present value is {value}.')
                     else:
+                        self.pinfo.setup.solution_freq = f'{value}GHz'
+                        continue
+                if key == 'max_passes':
+                    if not isinstance(value, int):
                         self.logger.warning(
-                            'The design does not have solution type as "Driven Modal". The Setup not updated.'
-                        )
-                else:
-                    self.logger.warning(
-                        'A design is not in active project. The Setup not updated.'
-                    )
-            else:
-                self.logger.warning(
-                    "Project not available, have you opened a project? Setup not updated."
+                            'The value for passes should be an int. '
+                            f'The present value is {value}.')
+                    else:
+                        self.pinfo.setup.passes = value
+                        continue
+                if key == 'pct_refinement':
+                    if not isinstance(value, int):
+                        self.logger.warning(
+                            'The value for pct_refinement should be an int. '
+                            f'The present value is {value}.')
+                    else:
+                        self.pinfo.setup.pct_refinement = value
+                        continue
+                if key == 'basis_order':
+                    if not isinstance(value, int):
+                        self.logger.warning(
+                            'The value for basis_order should be an int. '
+                            f'The present value is {value}.')
+                    else:
+                        self.pinfo.setup.basis_order = value
+                        continue
+
+                self.design.logger.warning(
+                    f'In setup_args, key={key}, value={value} is not in pinfo.setup, '
+                    'the key/value pair from setup_args not added to Setup in Ansys.'
                 )
+
         else:
             self.logger.warning(
-                "Have you run connect_ansys()?  "
-                "Cannot find a reference to Ansys in QRenderer. Setup not updated. "
+                'The design does not have solution type as "Driven Modal". The Setup not updated.'
             )
 
     def set_mode(self, mode: int, setup_name: str):
@@ -778,49 +754,36 @@ class QHFSSRenderer(QAnsysRenderer):
             mode (int): Identify a mode from 1 to n_modes.
             setup_name (str): Select a setup from the active design.
         """
-        if self.pinfo:
-            if self.pinfo.project:
-                if self.pinfo.design:
-                    # double parent, becasue self.pinfo.design does not work
-                    o_desktop = self.pinfo.design.parent.parent._desktop
-                    o_project = o_desktop.SetActiveProject(
-                        self.pinfo.project_name)
-                    o_design = o_project.GetActiveDesign()
-                    if o_design.GetSolutionType() == 'Eigenmode':
-                        # The set_mode() method is in HfssEMDesignSolutions
-                        #  class in pyEPR.
-                        # The class HfssEMDesignSolutions is instantiated by
-                        #  get_setup() and create_em_setup().
-                        setup = self.pinfo.get_setup(setup_name)
-                        if 0 < int(mode) <= int(setup.n_modes):
-                            setup_solutions = setup.get_solutions()
-                            if setup_solutions:
-                                setup_solutions.set_mode(mode)
-                            else:
-                                self.logger.warning(
-                                    'Not able to get setup_solutions, '
-                                    'the mode was not set.')
-                        else:
-                            self.logger.warning(
-                                f'The requested mode={mode} is not a valid '
-                                f'(1 to {setup.n_modes}) selection. '
-                                'The mode was not set.')
-                    else:
-                        self.logger.warning(
-                            'The design does not have solution type as '
-                            '"Eigenmode". The mode was not set.')
+        design = self._get_active_design('The mode was not set.')
+        if not design:
+            return
+
+        # double parent, becasue self.pinfo.design does not work
+        o_desktop = design.parent.parent._desktop
+        o_project = o_desktop.SetActiveProject(self.pinfo.project_name)
+        o_design = o_project.GetActiveDesign()
+        if o_design.GetSolutionType() == 'Eigenmode':
+            # The set_mode() method is in HfssEMDesignSolutions
+            #  class in pyEPR.
+            # The class HfssEMDesignSolutions is instantiated by
+            #  get_setup() and create_em_setup().
+            setup = self.pinfo.get_setup(setup_name)
+            if 0 < int(mode) <= int(setup.n_modes):
+                setup_solutions = setup.get_solutions()
+                if setup_solutions:
+                    setup_solutions.set_mode(mode)
                 else:
-                    self.logger.warning('A design is not in active project. '
-                                        'The mode was not set.')
+                    self.logger.warning('Not able to get setup_solutions, '
+                                        'the mode was not set.')
             else:
                 self.logger.warning(
-                    "Project not available, have you opened a project? "
-                    "The mode was not set.")
+                    f'The requested mode={mode} is not a valid '
+                    f'(1 to {setup.n_modes}) selection. '
+                    'The mode was not set.')
         else:
             self.logger.warning(
-                "Have you run connect_ansys()?  "
-                "Cannot find a reference to Ansys in QRenderer.  "
-                "The mode was not set.")
+                'The design does not have solution type as '
+                '"Eigenmode". The mode was not set.')
 
     def analyze_setup(self, setup_name: str):
         """Run a specific solution setup in Ansys HFSS.
@@ -829,9 +792,30 @@ class QHFSSRenderer(QAnsysRenderer):
             setup_name (str): Name of setup.
         """
         if self.pinfo:
-            setup = self.pinfo.get_setup(setup_name)
+            # Reuse the active setup rather than asking Ansys for it again.
+            setup = self.pinfo.setup
+            if setup is None or setup.name != setup_name:
+                setup = self.pinfo.get_setup(setup_name)
             setup.analyze(setup_name)
 
+    def get_eigenmodes(self) -> Tuple[Union[list, None], Union[list, None]]:
+        """Get the eigenmodes solved by the active setup.  The solutions of
+        the setup are kept, so calling again after each analysis of the same
+        setup does not ask Ansys for them again.
+
+        Returns:
+            tuple[list, list]: Frequencies and kappa/(2*pi) of the eigenmodes,
+            as given by pyEPR.  Both are None if not connected to Ansys.
+        """
+        if self.pinfo:
+            setup = self.pinfo.setup
+            cached_setup, solutions = self._eigenmode_solutions
+            if cached_setup is not setup:
+                solutions = setup.get_solutions()
+                self._eigenmode_solutions = (setup, solutions)
+            return solutions.eigenmodes()
+        return None, None
+
     def add_sweep(self,
                   setup_name="Setup",
                   start_ghz=2.0,
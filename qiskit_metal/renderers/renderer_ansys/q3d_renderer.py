@@ -15,7 +15,6 @@
 from typing import List, Union
 
 import pandas as pd
-from collections import defaultdict
 
 import pyEPR as epr
 from pyEPR.ansys import ureg
@@ -29,6 +28,30 @@ from .. import config
 if not config.is_building_docs():
     from qiskit_metal.analyses.quantization.lumped_capacitive import extract_transmon_coupled_Noscillator
 
+# Type of each argument of add_q3d_setup(), used to convert the parsed
+# defaults from default_setup.q3d
+_Q3D_SETUP_CASTS = dict(name=str,
+                        freq_ghz=float,
+                        save_fields=is_true,
+                        enabled=is_true,
+                        max_passes=int,
+                        min_passes=int,
+                        min_converged_passes=int,
+                        percent_error=float,
+                        percent_refinement=int,
+                        auto_increase_solution_order=is_true,
+                        solution_order=str,
+                        solver_type=str)
+
+# Keys of setup_args that edit_q3d_setup can change on the active setup,
+# as key: (expected type, attribute of pinfo.setup, value format or None).
+# EditSetup would need every argument at once, so the pyEPR properties are
+# used to change one at a time.
+_Q3D_SETUP_SETTERS = dict(freq_ghz=(float, 'frequency', '{}GHz'),
+                          max_passes=(int, 'max_pass', None),
+                          min_passes=(int, 'min_pass', None),
+                          percent_error=(float, 'pct_error', None))
+
 
 class QQ3DRenderer(QAnsysRenderer):
     """Subclass of QAnsysRenderer for running Q3D simulations.
@@ -124,9 +147,9 @@ class QQ3DRenderer(QAnsysRenderer):
                 'Unable to proceed with rendering. Please check selection.')
             return
 
-        self.chip_subtract_dict = defaultdict(set)
-        self.assign_perfE = []
-        self.assign_mesh = []
+        self.chip_subtract_dict.clear()
+        self.assign_perfE.clear()
+        self.assign_mesh.clear()
 
         self.render_tables(skip_junction=True)
         self.add_endcaps(open_pins)
@@ -204,50 +227,36 @@ class QQ3DRenderer(QAnsysRenderer):
             solution_order (str, optional): Solution order. Defaults to None.
             solver_type (str, optional): Solver type. Defaults to None.
         """
+        setup_args = dict(
+            name=name,
+            freq_ghz=freq_ghz,
+            save_fields=save_fields,
+            enabled=enabled,
+            max_passes=max_passes,
+            min_passes=min_passes,
+            min_converged_passes=min_converged_passes,
+            percent_error=percent_error,
+            percent_refinement=percent_refinement,
+            auto_increase_solution_order=auto_increase_solution_order,
+            solution_order=solution_order,
+            solver_type=solver_type)
+
+        # Fill in only the arguments that were not given, so that falsy values
+        # such as save_fields=False or min_passes=0 are kept.
+        # Flags are matched against the true strings as they are; parsing
+        # them as expressions would only hand back the same string.
         su = self.default_setup.q3d
-
-        if not name:
-            name = self.parse_value(su['name'])
-        if not freq_ghz:
-            freq_ghz = float(self.parse_value(su['freq_ghz']))
-        if not save_fields:
-            save_fields = is_true(su['save_fields'])
-        if not enabled:
-            enabled = is_true(su['enabled'])
-        if not max_passes:
-            max_passes = int(self.parse_value(su['max_passes']))
-        if not min_passes:
-            min_passes = int(self.parse_value(su['min_passes']))
-        if not min_converged_passes:
-            min_converged_passes = int(
-                self.parse_value(su['min_converged_passes']))
-        if not percent_error:
-            percent_error = float(self.parse_value(su['percent_error']))
-        if not percent_refinement:
-            percent_refinement = int(self.parse_value(su['percent_refinement']))
-        if not auto_increase_solution_order:
-            auto_increase_solution_order = is_true(
-                su['auto_increase_solution_order'])
-        if not solution_order:
-            solution_order = self.parse_value(su['solution_order'])
-        if not solver_type:
-            solver_type = self.parse_value(su['solver_type'])
+        for key, value in setup_args.items():
+            if value is None:
+                cast = _Q3D_SETUP_CASTS[key]
+                default = su[key]
+                if cast is not is_true:
+                    default = self.parse_value(default)
+                setup_args[key] = cast(default)
 
         if self.pinfo:
             if self.pinfo.design:
-                return self.pinfo.design.create_q3d_setup(
-                    freq_ghz=freq_ghz,
-                    name=name,
-                    save_fields=save_fields,
-                    enabled=enabled,
-                    max_passes=max_passes,
-                    min_passes=min_passes,
-                    min_converged_passes=min_converged_passes,
-                    percent_error=percent_error,
-                    percent_refinement=percent_refinement,
-                    auto_increase_solution_order=auto_increase_solution_order,
-                    solution_order=solution_order,
-                    solver_type=solver_type)
+                return self.pinfo.design.create_q3d_setup(**setup_args)
 
     def edit_q3d_setup(self, setup_args: Dict):
         """User can pass key/values to edit the setup for active q3d setup.
@@ -276,100 +285,43 @@ class QQ3DRenderer(QAnsysRenderer):
             * solver_type (str, optional): Solver type. Defaults to 'Iterative'.
         """
 
-        if self.pinfo:
-            if self.pinfo.project:
-                if self.pinfo.design:
-                    if self.pinfo.design.solution_type == 'Q3D':
-                        if self.pinfo.setup_name != setup_args.name:
-                            self.design.logger.warning(
-                                f'The name of active setup={self.pinfo.setup_name} does not match'
-                                f'the name of of setup_args.name={setup_args.name}. '
-                                f'To use this method, activate the desired Setup before editing it. '
-                                f'The setup_args was not used to update the active Setup.'
-                            )
-                            return
-
-                        for key, value in setup_args.items():
-                            if key == "name":
-                                continue  #Checked for above.
-                            if key == "freq_ghz":
-                                if not isinstance(value, float):
-                                    self.logger.warning(
-                                        'The value for min_freq_ghz should be a '
-                                        f'float.  The present value is {value}.'
-                                    )
-                                else:
-                                    ### This EditSetup works if we change all of the arguments
-                                    # at the same time.  We don't always want to change all of them.
-                                    # Need to have a way to read all of the arguments to
-                                    # avoid overwriting arguments. Presently, will use
-                                    # the variables set in pyEPR with @property.
-                                    # args_editsetup = [
-                                    #     f"NAME:{setup_args.name}",
-                                    #     "AdaptiveFreq:=", f"{value}GHz",
-                                    #     "SaveFields:=", False, "Enabled:=",
-                                    #     True,
-                                    #     [
-                                    #         "NAME:Cap", "MaxPass:=", 15,
-                                    #         "MinPass:=", 2, "MinConvPass:=", 2,
-                                    #         "PerError:=", 0.5, "PerRefine:=",
-                                    #         30, "AutoIncreaseSolutionOrder:=",
-                                    #         True, "SolutionOrder:=", "High",
-                                    #         "Solver Type:=", "Iterative"
-                                    #     ]
-                                    # ]
-                                    # self.pinfo.design._setup_module.EditSetup(
-                                    #     setup_args.name, args_editsetup)
-                                    self.pinfo.setup.frequency = f"{value}GHz"
-                                    continue
-                            if key == 'max_passes':
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for max_passes should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.max_pass = value
-                                    continue
-
-                            if key == 'min_passes':
-                                if not isinstance(value, int):
-                                    self.logger.warning(
-                                        'The value for min_passes should be an int. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.min_pass = value
-                                    continue
-
-                            if key == 'percent_error':
-                                if not isinstance(value, float):
-                                    self.logger.warning(
-                                        'The value for percent_error should be a float. '
-                                        f'The present value is {value}.')
-                                else:
-                                    self.pinfo.setup.pct_error = value
-                                    continue
-
-                            self.design.logger.warning(
-                                f'In setup_args, key={key}, value={value} is not in pinfo.setup, '
-                                'the key/value pair from setup_args not added to Setup in Ansys.'
-                            )
+        design = self._get_active_design('Setup not updated.')
+        if not design:
+            return
 
-                    else:
+        if design.solution_type == 'Q3D':
+            if self.pinfo.setup_name != setup_args.name:
+                self.design.logger.warning(
+                    f'The name of active setup={self.pinfo.setup_name} does not match'
+                    f'the name of of setup_args.name={setup_args.name}. '
+                    f'To use this method, activate the desired Setup before editing it. '
+                    f'The setup_args was not used to update the active Setup.'
+                )
+                return
+
+            for key, value in setup_args.items():
+                if key == "name":
+                    continue  #Checked for above.
+                if key in _Q3D_SETUP_SETTERS:
+                    value_type, attr, fmt = _Q3D_SETUP_SETTERS[key]
+                    if not isinstance(value, value_type):
                         self.logger.warning(
-                            'The design does not have solution type as "Q3D". The Setup not updated.'
+                            f'The value for {key} should be of type '
+                            f'{value_type.__name__}. The present value is {value}.'
                         )
-                else:
-                    self.logger.warning(
-                        'A design is not in active project. The Setup not updated.'
-                    )
-            else:
-                self.logger.warning(
-                    "Project not available, have you opened a project? Setup not updated."
+                    else:
+                        setattr(self.pinfo.setup, attr,
+                                fmt.format(value) if fmt else value)
+                        continue
+
+                self.design.logger.warning(
+                    f'In setup_args, key={key}, value={value} is not in pinfo.setup, '
+                    'the key/value pair from setup_args not added to Setup in Ansys.'
                 )
+
         else:
             self.logger.warning(
-                "Have you run connect_ansys()?  "
-                "Cannot find a reference to Ansys in QRenderer. Setup not updated. "
+                'The design does not have solution type as "Q3D". The Setup not updated.'
             )
 
     def analyze_setup(self, setup_name: str):
@@ -379,7 +331,10 @@ class QQ3DRenderer(QAnsysRenderer):
             setup_name (str): Name of setup.
         """
         if self.pinfo:
-            setup = self.pinfo.get_setup(setup_name)
+            # Reuse the active setup rather than asking Ansys for it again.
+            setup = self.pinfo.setup
+            if setup is None or setup.name != setup_name:
+                setup = self.pinfo.get_setup(setup_name)
             setup.analyze(setup_name)
 
     def get_capacitance_matrix(self,
@@ -420,15 +375,26 @@ class QQ3DRenderer(QAnsysRenderer):
             dict, str: dict of pd.DataFrames containing the capacitance matrix
                 for each simulation pass, and units.
         """
-        # TODO: is there a way to get all of the matrices in one query?
-        #  If yes, change get_capacitance_matrix() to get all the matrices and delete this.
         all_mtx = {}
+        user_units = None
+        if not self.pinfo:
+            return all_mtx, user_units
+        # Ansys exports a single pass per ExportMatrixData call, so one query
+        # per pass is unavoidable; resolve the setup once for all of them.
+        setup = self.pinfo.setup
+        # the units are the same for (almost) every pass; convert each only once
+        farads_per_unit = {}
         for i in range(1, 1000):  #1000 is an arbitrary large number
             try:
-                df_cmat, user_units = self.get_capacitance_matrix(
-                    variation, 'AdaptivePass', pass_number=i)
-                c_units = ureg(user_units).to('farads').magnitude
-                all_mtx[i] = df_cmat.values * c_units
+                df_cmat, user_units, _, _ = setup.get_matrix(
+                    variation=variation,
+                    solution_kind='AdaptivePass',
+                    pass_number=i)
+                c_units = farads_per_unit.get(user_units)
+                if c_units is None:
+                    c_units = ureg(user_units).to('farads').magnitude
+                    farads_per_unit[user_units] = c_units
+                all_mtx[i] = df_cmat.to_numpy(dtype=float) * c_units
             except pd.errors.EmptyDataError:
                 break
         return all_mtx, user_units
@@ -538,12 +538,13 @@ class QGDSRenderer(QRenderer):
         if highlight_qcomponents is None:
             highlight_qcomponents = []
 
-        # Remove identical QComponent names.
-        unique_qcomponents = list(set(highlight_qcomponents))
+        # Remove identical QComponent names, keeping the order given.
+        unique_qcomponents = list(dict.fromkeys(highlight_qcomponents))
 
         # Confirm all QComponent are in design.
+        name_to_id = self.design.name_to_id
         for qcomp in unique_qcomponents:
-            if qcomp not in self.design.name_to_id:
+            if qcomp not in name_to_id:
                 self.logger.warning(
                     f'The component={qcomp} in highlight_qcomponents not'
                     ' in QDesign. The GDS data not generated.')
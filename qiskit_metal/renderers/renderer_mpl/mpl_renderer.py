@@ -33,6 +33,7 @@ from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib.figure import Figure
 from matplotlib.transforms import Bbox
 
+import shapely
 from shapely.geometry import CAP_STYLE, JOIN_STYLE, LineString
 
 from ... import Dict
@@ -55,6 +56,9 @@ __all__ = ['QMplRenderer']
 
 to_poly_patch = np.vectorize(PolygonPatch)
 
+# Vectorized geometry functions are only available from shapely 2.0
+_VECTORIZED_SHAPELY = hasattr(shapely, 'polygons')
+
 
 class QMplRenderer():
     """Matplotlib handle all rendering of an axis.
@@ -260,6 +264,53 @@ class QMplRenderer():
             render_func = getattr(self, f'render_{element_type}')
             render_func(table1, ax, subtracted=False)
 
+    def _buffer_paths(self, table: pd.DataFrame) -> list:
+        """Buffer every path in the table by half its width, with flat caps
+        and mitred joins.
+
+        With shapely 2 the whole column is handled in vectorized calls:
+        straight two-point paths (e.g., junctions) are outlined directly as
+        rectangles, and only the remaining paths go through the GEOS buffer.
+        Otherwise each path is buffered in turn. Flat caps and mitred joins
+        have no arcs, so the buffers use a single segment per quadrant.
+
+        Args:
+            table (DataFrame): Path or junction table with nonzero widths
+
+        Returns:
+            list: The buffered polygons, in table order
+        """
+        distances = table.width.to_numpy(dtype=float) / 2.
+        if not _VECTORIZED_SHAPELY:
+            return [
+                path.buffer(distance=distance,
+                            cap_style=CAP_STYLE.flat,
+                            join_style=JOIN_STYLE.mitre,
+                            resolution=1)
+                for path, distance in zip(table.geometry, distances)
+            ]
+
+        paths = table.geometry.to_numpy()
+        polys = np.empty(len(paths), dtype=object)
+        straight = (shapely.get_num_coordinates(paths)
+                    == 2) & (shapely.length(paths) > 0)
+        if straight.any():
+            ends = shapely.get_coordinates(paths[straight]).reshape(-1, 2, 2)
+            tangents = ends[:, 1] - ends[:, 0]
+            scale = distances[straight] / np.linalg.norm(tangents, axis=1)
+            offsets = tangents[:, ::-1] * [-1., 1.] * scale[:, None]
+            polys[straight] = shapely.polygons(
+                np.stack((ends[:, 0] + offsets, ends[:, 1] + offsets,
+                          ends[:, 1] - offsets, ends[:, 0] - offsets),
+                         axis=1))
+        if not straight.all():
+            polys[~straight] = shapely.buffer(paths[~straight],
+                                              distances[~straight],
+                                              quad_segs=1,
+                                              cap_style='flat',
+                                              join_style='mitre')
+        return list(polys)
+
     def render_junction(self,
                         table: pd.DataFrame,
                         ax: Axes,
@@ -276,13 +327,7 @@ class QMplRenderer():
             mask = (table.width == 0) | table.width.isna()
             table1 = table[~mask]
             if len(table1) > 0:
-                table1.geometry = table1[['geometry', 'width']].apply(
-                    lambda x: x[0].buffer(distance=float(x[1]) / 2.,
-                                          cap_style=CAP_STYLE.flat,
-                                          join_style=JOIN_STYLE.mitre,
-                                          resolution=int(self.options[
-                                              'resolution'])),
-                    axis=1)
+                table1.geometry = self._buffer_paths(table1)
                 kw = self.get_style('JJ', subtracted=subtracted, extra=extra_kw)
                 self.render_poly(table1, ax, subtracted=subtracted, extra_kw=kw)
             table1 = table[mask]
@@ -465,12 +510,7 @@ class QMplRenderer():
                        self.fillet_path, axis=1)
 
         if len(table1) > 0:
-            table1.geometry = table1[['geometry', 'width']].apply(lambda x: x[
-                0].buffer(distance=float(x[1]) / 2.,
-                          cap_style=CAP_STYLE.flat,
-                          join_style=JOIN_STYLE.mitre,
-                          resolution=int(self.options['resolution'])),
-                                                                  axis=1)
+            table1.geometry = self._buffer_paths(table1)
 
             kw = self.get_style('poly', subtracted=subtracted, extra=extra_kw)
 
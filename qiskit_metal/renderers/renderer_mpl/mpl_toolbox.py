@@ -138,7 +138,7 @@ def render(
     kw = kw or {}
     ax = ax or plt.gca()
 
-    if labels is 'auto':
+    if isinstance(labels, str) and labels == 'auto':
         labels = list(map(str, range(len(components))))
 
     if not labels is None:
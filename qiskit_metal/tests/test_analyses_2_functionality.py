@@ -29,8 +29,14 @@ from qiskit_metal.analyses.hamiltonian.transmon_charge_basis import Hcpb
 from qiskit_metal.analyses.hamiltonian.HO_wavefunctions import wavefunction
 from qiskit_metal.analyses.em import cpw_calculations, kappa_calculation
 from qiskit_metal.analyses.sweep_and_optimize.sweeper import Sweeper
+from qiskit_metal.analyses.sweep_and_optimize import sweeping
 from qiskit_metal.tests.assertions import AssertionsMixin
 from qiskit_metal import designs
+from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
+from qiskit_metal.qlibrary.tlines.anchored_path import RouteAnchors
+from qiskit_metal.qlibrary.tlines.pathfinder import RoutePathfinder
+from qiskit_metal.qlibrary.tlines.straight_path import RouteStraight
+from qiskit_metal import Dict
 
 TEST_DATA = Path(__file__).parent / "test_data"
 
@@ -781,6 +787,150 @@ class TestAnalyses(unittest.TestCase, AssertionsMixin):
         self.assertEqual(sweeper.option_value(in_dict, 'a'), 1)
         self.assertEqual(sweeper.option_value(in_dict, 'b'), 'bee')
 
+    def test_analysis_sweeping_check_setup_args(self):
+        """Test the check_setup_args function in the Sweeping class"""
+        design = designs.DesignPlanar()
+        a_sweep = sweeping.Sweeping(design)
+        schema = sweeping._Q3D_SETUP_SCHEMA
+
+        self.assertEqual(
+            a_sweep.check_setup_args(
+                Dict(name='a', max_passes=5, freq_ghz=None,
+                     solution_order='Higher'), schema), 0)
+        self.assertEqual(
+            a_sweep.check_setup_args(Dict(max_passes=5.0), schema), 1)
+
+        setup_args = Dict(freq_ghz=5, percent_error=0.5)
+        self.assertEqual(a_sweep.check_setup_args(setup_args, schema), 0)
+        self.assertIsInstance(setup_args.freq_ghz, float)
+        self.assertEqual(
+            a_sweep.check_setup_args(Dict(freq_ghz=True), schema), 1)
+        self.assertEqual(
+            a_sweep.check_setup_args(Dict(solution_order='Low'), schema), 1)
+        self.assertEqual(
+            a_sweep.check_setup_args(Dict(max_pass=5), schema), 2)
+        self.assertEqual(
+            a_sweep.check_setup_args(Dict(max_passes=5.0, max_pass=5),
+                                     schema), 2)
+
+    def test_analysis_sweeping_error_check_sweep_input(self):
+        """Test the error_check_sweep_input function in the Sweeping class"""
+        design = designs.DesignPlanar()
+        TransmonPocket(design,
+                       'Q1',
+                       options=dict(connection_pads=dict(a=dict())))
+        a_sweep = sweeping.Sweeping(design)
+
+        option_path, a_value, result = a_sweep.error_check_sweep_input(
+            'Q1', 'connection_pads.a.pad_width', ['100um', '120um'])
+        self.assertEqual(result, 0)
+        self.assertEqual(option_path, ['connection_pads', 'a', 'pad_width'])
+        self.assertIs(a_value,
+                      design.components['Q1'].options.connection_pads.a)
+
+        self.assertEqual(
+            a_sweep.error_check_sweep_input('Q2', 'pad_gap', ['30um'])[2], 1)
+        self.assertEqual(
+            a_sweep.error_check_sweep_input('Q1', '', ['30um'])[2], 2)
+        self.assertEqual(
+            a_sweep.error_check_sweep_input('Q1', 'connection_pads.b.pad_width',
+                                            ['30um'])[2], 3)
+        self.assertEqual(
+            a_sweep.error_check_sweep_input('Q1', 'pad_gap', [])[2], 4)
+        self.assertEqual(
+            a_sweep.error_check_sweep_input('Q1', 'connection_pads.a.pad_wid',
+                                            ['30um'])[2], 5)
+
+    def test_analysis_sweeping_components_to_rebuild(self):
+        """Test the components_to_rebuild function in the Sweeping class"""
+        design = designs.DesignPlanar()
+        q_1 = TransmonPocket(design,
+                             'Q1',
+                             options=dict(pos_x='-1mm',
+                                          connection_pads=dict(a=dict())))
+        q_2 = TransmonPocket(design,
+                             'Q2',
+                             options=dict(pos_x='1mm',
+                                          connection_pads=dict(a=dict())))
+        q_3 = TransmonPocket(design, 'Q3', options=dict(pos_y='2mm'))
+        route = RouteStraight(design,
+                              'route',
+                              options=dict(pin_inputs=dict(
+                                  start_pin=dict(component='Q1', pin='a'),
+                                  end_pin=dict(component='Q2', pin='a'))))
+        a_sweep = sweeping.Sweeping(design)
+
+        self.assertEqual(a_sweep.components_to_rebuild('Q1'), [q_1, route])
+        self.assertEqual(a_sweep.components_to_rebuild('Q3'), [q_3])
+        self.assertEqual(a_sweep.components_to_rebuild('route'), [route])
+        self.assertNotIn(q_2, a_sweep.components_to_rebuild('Q1'))
+
+    def test_analysis_sweeping_components_to_rebuild_avoid_collision(self):
+        """Test that components_to_rebuild in the Sweeping class includes
+        the routes that avoid collisions, even if not connected"""
+        design = designs.DesignPlanar()
+        q_1 = TransmonPocket(design, 'Q1', options=dict(pos_x='-1mm'))
+        TransmonPocket(design,
+                       'Q2',
+                       options=dict(pos_x='1mm',
+                                    connection_pads=dict(a=dict(), b=dict())))
+        TransmonPocket(design,
+                       'Q3',
+                       options=dict(pos_y='2mm',
+                                    connection_pads=dict(a=dict(), b=dict())))
+        finder = RoutePathfinder(design,
+                                 'finder',
+                                 options=dict(pin_inputs=dict(
+                                     start_pin=dict(component='Q2', pin='a'),
+                                     end_pin=dict(component='Q3', pin='a'))),
+                                 make=False)
+        avoiding = RouteAnchors(design,
+                                'avoiding',
+                                options=dict(
+                                    pin_inputs=dict(
+                                        start_pin=dict(component='Q2',
+                                                       pin='b'),
+                                        end_pin=dict(component='Q3', pin='b')),
+                                    advanced=dict(avoid_collision='true')),
+                                make=False)
+        anchors = RouteAnchors(design, 'anchors', make=False)
+        a_sweep = sweeping.Sweeping(design)
+
+        self.assertEqual(a_sweep.components_to_rebuild('Q1'),
+                         [q_1, finder, avoiding])
+        self.assertNotIn(anchors, a_sweep.components_to_rebuild('Q1'))
+
+    def test_analysis_sweeping_sweep_to_dataframe(self):
+        """Test the sweep_to_dataframe function in the Sweeping class"""
+        all_sweep = Dict()
+        all_sweep['5um'] = Dict(option_name='pad_gap',
+                                frequency=[5.1, 6.2],
+                                convergence=True)
+        all_sweep['10um'] = Dict(option_name='pad_gap',
+                                 frequency=[5.3, 6.4])
+
+        result = sweeping.Sweeping.sweep_to_dataframe(all_sweep)
+        self.assertEqual(list(result.index), ['5um', '10um'])
+        self.assertEqual(list(result.columns),
+                         ['option_name', 'frequency', 'convergence'])
+        self.assertEqual(result.loc['10um', 'frequency'], [5.3, 6.4])
+        self.assertTrue(result.loc['5um', 'convergence'])
+        self.assertTrue(pd.isna(result.loc['10um', 'convergence']))
+
+    def test_analysis_sweeping_get_quality_factor(self):
+        """Test the get_quality_factor function in the Sweeping class"""
+        design = designs.DesignPlanar()
+        a_sweep = sweeping.Sweeping(design)
+
+        result = a_sweep.get_quality_factor([5.0, 6.0], [0.5, 2.0])
+        self.assertIsInstance(result, list)
+        self.assertEqual(len(result), 2)
+        self.assertAlmostEqualRel(10.0, result[0], rel_tol=1e-6)
+        self.assertAlmostEqualRel(3.0, result[1], rel_tol=1e-6)
+
+        self.assertIsNone(a_sweep.get_quality_factor([5.0], None))
+        self.assertIsNone(a_sweep.get_quality_factor([5.0], [1.0, 2.0]))
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -503,6 +503,24 @@ class TestDraw(unittest.TestCase, AssertionsMixin):
                                           expected[i][j],
                                           rel_tol=1e-3)
 
+    def test_draw_utility_to_vec3D(self):
+        """Test to_vec3D in utility.py."""
+        points_list = [(0, 0), (1.5, 2), (-1, 3.25)]
+        expected = [[0, 0, 0.2], [1.5, 2, 0.2], [-1, 3.25, 0.2]]
+
+        actual = utility.to_vec3D(points_list, 0.2)
+        self.assertEqual(actual.shape, (3, 3))
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqualRel(actual[i][j],
+                                          expected[i][j],
+                                          rel_tol=1e-3)
+
+        actual = utility.to_vec3D(np.array(points_list))
+        self.assertEqual(list(actual[:, 2]), [0, 0, 0])
+
+        self.assertEqual(len(utility.to_vec3D([])), 0)
+
     def test_draw_vector_normal_z(self):
         """Test that normal_z in Vector class was not accidentally changed."""
         expected_list = [0, 0, 1]
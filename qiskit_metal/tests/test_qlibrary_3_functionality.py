@@ -530,6 +530,30 @@ class TestComponentFunctionality(unittest.TestCase, AssertionsMixin):
             anchored_path.intersecting(np.array([1, 1]), np.array([3, 3]),
                                        np.array([5, 5]), np.array([7, 7])))
 
+    def test_qlibrary_qroute_del_colinear_points(self):
+        """Test del_colinear_points in qroute.py"""
+        design = designs.DesignPlanar()
+        route = RouteMeander(design, 'my_route', make=False)
+
+        points = np.array([[0, 0], [1, 0], [1, 0], [2, 0], [2, 1], [2, 3],
+                           [1, 3], [2, 3]])
+        expected = np.array([[0, 0], [2, 0], [2, 3], [1, 3], [2, 3]])
+        result = route.del_colinear_points(points)
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected))
+
+        # Nearly colinear: the direction is checked against the last point
+        # kept, so the small drift adds up and the corner at [2, 8e-6] stays
+        points = np.array([[0, 0], [1, 0], [2, 8e-6], [3, 2.4e-5]])
+        expected = np.array([[0, 0], [2, 8e-6], [3, 2.4e-5]])
+        result = route.del_colinear_points(points)
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected))
+
+        result = route.del_colinear_points(np.array([[0, 0], [0, 0]]))
+        self.assertTrue(np.allclose(result, np.array([[0, 0]])))
+        self.assertIsNone(route.del_colinear_points(np.array([[0, 0]])))
+
     @staticmethod
     def generate_spiral_list(x: int, y: int):
         """Helper function to generate a sprital list.
@@ -20,9 +20,9 @@
 """Qiskit Metal unit tests analyses functionality."""
 
 import unittest
-import matplotlib.pyplot as _plt
+from types import MappingProxyType, SimpleNamespace
 
-from qiskit_metal import designs
+from qiskit_metal.designs.design_planar import DesignPlanar
 from qiskit_metal.renderers import setup_default
 from qiskit_metal.renderers.renderer_ansys.ansys_renderer import QAnsysRenderer
 from qiskit_metal.renderers.renderer_ansys.q3d_renderer import QQ3DRenderer
@@ -34,14 +34,153 @@ from qiskit_metal.renderers.renderer_mpl.mpl_interaction import MplInteraction
 
 from qiskit_metal.renderers.renderer_ansys import ansys_renderer
 
-from qiskit_metal.qgeometries.qgeometries_handler import QGeometryTables
-from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
-from qiskit_metal import draw
+
+EXPECTED_ANSYS_OPTIONS = {
+    'Lj': '10nH',
+    'Cj': 0,
+    '_Rj': 0,
+    'max_mesh_length_jj': '7um',
+    'project_path': None,
+    'project_name': None,
+    'design_name': None,
+    'x_buffer_width_mm': 0.2,
+    'y_buffer_width_mm': 0.2,
+    'wb_threshold': '400um',
+    'wb_offset': '0um',
+    'wb_size': 5,
+    'plot_ansys_fields_options': {
+        'name': "NAME:Mag_E1",
+        'UserSpecifyName': '0',
+        'UserSpecifyFolder': '0',
+        'QuantityName': "Mag_E",
+        'PlotFolder': "E Field",
+        'StreamlinePlot': "False",
+        'AdjacentSidePlot': "False",
+        'FullModelPlot': "False",
+        'IntrinsicVar': "Phase=\'0deg\'",
+        'PlotGeomInfo_0': "1",
+        'PlotGeomInfo_1': "Surface",
+        'PlotGeomInfo_2': "FacesList",
+        'PlotGeomInfo_3': "1",
+    },
+}
+
+EXPECTED_ANSYS_DEFAULT_SETUP = {
+    'drivenmodal': {
+        'name': "Setup",
+        'freq_ghz': '5.0',
+        'max_delta_s': '0.1',
+        'max_passes': '10',
+        'min_passes': '1',
+        'min_converged': '1',
+        'pct_refinement': '30',
+        'basis_order': '1',
+    },
+    'eigenmode': {
+        'name': "Setup",
+        'min_freq_ghz': '1',
+        'n_modes': '1',
+        'max_delta_f': '0.5',
+        'max_passes': '10',
+        'min_passes': '1',
+        'min_converged': '1',
+        'pct_refinement': '30',
+        'basis_order': '-1',
+    },
+    'q3d': {
+        'name': 'Setup',
+        'freq_ghz': '5.0',
+        'save_fields': 'False',
+        'enabled': 'True',
+        'max_passes': '15',
+        'min_passes': '2',
+        'min_converged_passes': '2',
+        'percent_error': '0.5',
+        'percent_refinement': '30',
+        'auto_increase_solution_order': 'True',
+        'solution_order': 'High',
+        'solver_type': 'Iterative',
+    },
+    'port_inductor_gap': '10um',
+}
+
+EXPECTED_Q3D_OPTIONS = {
+    'material_type': 'pec',
+    'material_thickness': '200nm',
+}
+
+EXPECTED_HFSS_OPTIONS = {
+    'port_inductor_gap': '10um',
+}
+
+EXPECTED_GDS_OPTIONS = {
+    'short_segments_to_not_fillet': 'True',
+    'check_short_segments_by_scaling_fillet': '2.0',
+    'gds_unit': '1',
+    'ground_plane': 'True',
+    'negative_mask': {
+        'main': []
+    },
+    'corners': 'circular bend',
+    'tolerance': '0.00001',
+    'precision': '0.000000001',
+    'width_LineString': '10um',
+    'path_filename': '../resources/Fake_Junctions.GDS',
+    'junction_pad_overlap': '5um',
+    'max_points': '199',
+    'bounding_box_scale_x': '1.2',
+    'bounding_box_scale_y': '1.2',
+    'cheese': {
+        'datatype': '100',
+        'shape': '0',
+        'cheese_0_x': '25um',
+        'cheese_0_y': '25um',
+        'cheese_1_radius': '100um',
+        'delta_x': '100um',
+        'delta_y': '100um',
+        'edge_nocheese': '200um',
+        'view_in_file': {
+            'main': {
+                1: True
+            }
+        },
+    },
+    'no_cheese': {
+        'datatype': '99',
+        'buffer': '25um',
+        'cap_style': '2',
+        'join_style': '2',
+        'view_in_file': {
+            'main': {
+                1: True
+            }
+        },
+    },
+}
 
 
 class TestRenderers(unittest.TestCase):
     """Unit test class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the design and renderers shared by the read-only tests.
+
+        Tests that change the design or a renderer build their own.
+        """
+        cls.design = DesignPlanar()
+        cls.ansys_renderer = QAnsysRenderer(cls.design, initiate=False)
+        cls.q3d_renderer = QQ3DRenderer(cls.design, initiate=False)
+        cls.hfss_renderer = QHFSSRenderer(cls.design, initiate=False)
+        cls.gds_renderer = QGDSRenderer(cls.design)
+
+        # Read-only views of the defaults checked by the options tests
+        cls.ansys_options = MappingProxyType(
+            cls.ansys_renderer.default_options)
+        cls.q3d_options = MappingProxyType(cls.q3d_renderer.q3d_options)
+        cls.hfss_options = MappingProxyType(cls.hfss_renderer.hfss_options)
+        cls.gds_options = MappingProxyType(cls.gds_renderer.default_options)
+
     def setUp(self):
         """Setup unit test."""
         pass
@@ -52,243 +191,131 @@ class TestRenderers(unittest.TestCase):
 
     def test_renderer_instanitate_qansys_renderer(self):
         """Test instantiation of QAnsysRenderer in ansys_renderer.py"""
-        design = designs.DesignPlanar()
-        try:
-            QAnsysRenderer(design, initiate=False)
-        except Exception:
-            self.fail("QAnsysRenderer() failed")
+        QAnsysRenderer(self.design, initiate=False)
 
     def test_renderer_instantiate_gdsrender(self):
         """Test instantiation of QGDSRenderer in gds_renderer.py."""
-        design = designs.DesignPlanar()
-        try:
-            QGDSRenderer(design)
-        except Exception:
-            self.fail("QGDSRenderer(design) failed")
-
-        try:
-            QGDSRenderer(design, initiate=False)
-        except Exception:
-            self.fail("QGDSRenderer(design, initiate=False) failed")
-
-        try:
-            QGDSRenderer(design, initiate=False, render_template={})
-        except Exception:
-            self.fail(
-                "QGDSRenderer(design, initiate=False, render_template={}) failed"
-            )
-
-        try:
-            QGDSRenderer(design, initiate=False, render_options={})
-        except Exception:
-            self.fail(
-                "QGDSRenderer(design, initiate=False, render_options={}) failed"
-            )
+        for kwargs in (dict(), dict(initiate=False),
+                       dict(initiate=False, render_template={}),
+                       dict(initiate=False, render_options={})):
+            with self.subTest(kwargs=kwargs):
+                QGDSRenderer(self.design, **kwargs)
 
     def test_renderer_instantiate_mplinteraction(self):
         """Test instantiation of MplInteraction in mpl_interaction.py."""
-        try:
-            MplInteraction(_plt)
-        except Exception:
-            self.fail("MplInteraction(None) failed")
+        import matplotlib.pyplot as _plt
+        MplInteraction(_plt)
 
     def test_renderer_instantiate_qq3d_renderer(self):
         """Test instantiation of QQ3DRenderer in q3d_render.py."""
-        design = designs.DesignPlanar()
-        try:
-            QQ3DRenderer(design, initiate=False)
-        except Exception:
-            self.fail("QQ3DRenderer failed")
+        QQ3DRenderer(self.design, initiate=False)
 
     def test_renderer_instantiate_qhfss_renderer(self):
         """Test instantiation of QHFSSRenderer in q3d_render.py."""
-        design = designs.DesignPlanar()
-        try:
-            QHFSSRenderer(design, initiate=False)
-        except Exception:
-            self.fail("QHFSSRenderer failed")
+        QHFSSRenderer(self.design, initiate=False)
 
     def test_renderer_qansys_renderer_options(self):
         """Test that defaults in QAnsysRenderer were not accidentally changed."""
-        design = designs.DesignPlanar()
-        renderer = QAnsysRenderer(design, initiate=False)
-        options = renderer.default_options
-
-        self.assertEqual(len(options), 13)
-        self.assertEqual(options['Lj'], '10nH')
-        self.assertEqual(options['Cj'], 0)
-        self.assertEqual(options['_Rj'], 0)
-        self.assertEqual(options['max_mesh_length_jj'], '7um')
-        self.assertEqual(options['project_path'], None)
-        self.assertEqual(options['project_name'], None)
-        self.assertEqual(options['design_name'], None)
-        self.assertEqual(options['x_buffer_width_mm'], 0.2)
-        self.assertEqual(options['y_buffer_width_mm'], 0.2)
-        self.assertEqual(options['wb_threshold'], '400um')
-        self.assertEqual(options['wb_offset'], '0um')
-        self.assertEqual(options['wb_size'], 5)
-
-        self.assertEqual(len(options['plot_ansys_fields_options']), 13)
-        self.assertEqual(options['plot_ansys_fields_options']['name'],
-                         "NAME:Mag_E1")
-        self.assertEqual(
-            options['plot_ansys_fields_options']['UserSpecifyName'], '0')
-        self.assertEqual(
-            options['plot_ansys_fields_options']['UserSpecifyFolder'], '0')
-        self.assertEqual(options['plot_ansys_fields_options']['QuantityName'],
-                         "Mag_E")
-        self.assertEqual(options['plot_ansys_fields_options']['PlotFolder'],
-                         "E Field")
-        self.assertEqual(options['plot_ansys_fields_options']['StreamlinePlot'],
-                         "False")
-        self.assertEqual(
-            options['plot_ansys_fields_options']['AdjacentSidePlot'], "False")
-        self.assertEqual(options['plot_ansys_fields_options']['FullModelPlot'],
-                         "False")
-        self.assertEqual(options['plot_ansys_fields_options']['IntrinsicVar'],
-                         "Phase=\'0deg\'")
-        self.assertEqual(options['plot_ansys_fields_options']['PlotGeomInfo_0'],
-                         "1")
-        self.assertEqual(options['plot_ansys_fields_options']['PlotGeomInfo_1'],
-                         "Surface")
-        self.assertEqual(options['plot_ansys_fields_options']['PlotGeomInfo_2'],
-                         "FacesList")
-        self.assertEqual(options['plot_ansys_fields_options']['PlotGeomInfo_3'],
-                         "1")
+        self.assertEqual(dict(self.ansys_options), EXPECTED_ANSYS_OPTIONS)
 
     def test_renderer_qansysrenderer_default_setup(self):
         """Test that default_setup in QAnsysRenderer have not been accidentally changed."""
-        default_setup = QAnsysRenderer.default_setup
-
-        self.assertEqual(len(default_setup), 4)
-        self.assertEqual(len(default_setup['drivenmodal']), 8)
-        self.assertEqual(len(default_setup['eigenmode']), 9)
-        self.assertEqual(len(default_setup['q3d']), 12)
-        self.assertEqual(default_setup['port_inductor_gap'], '10um')
-
-        self.assertEqual(default_setup['drivenmodal']['name'], "Setup")
-        self.assertEqual(default_setup['drivenmodal']['freq_ghz'], '5.0')
-        self.assertEqual(default_setup['drivenmodal']['max_delta_s'], '0.1')
-        self.assertEqual(default_setup['drivenmodal']['max_passes'], '10')
-        self.assertEqual(default_setup['drivenmodal']['min_passes'], '1')
-        self.assertEqual(default_setup['drivenmodal']['min_converged'], '1')
-        self.assertEqual(default_setup['drivenmodal']['pct_refinement'], '30')
-        self.assertEqual(default_setup['drivenmodal']['basis_order'], '1')
-
-        self.assertEqual(default_setup['eigenmode']['name'], "Setup")
-        self.assertEqual(default_setup['eigenmode']['min_freq_ghz'], '1')
-        self.assertEqual(default_setup['eigenmode']['n_modes'], '1')
-        self.assertEqual(default_setup['eigenmode']['max_delta_f'], '0.5')
-        self.assertEqual(default_setup['eigenmode']['max_passes'], '10')
-        self.assertEqual(default_setup['eigenmode']['min_passes'], '1')
-        self.assertEqual(default_setup['eigenmode']['min_converged'], '1')
-        self.assertEqual(default_setup['eigenmode']['pct_refinement'], '30')
-        self.assertEqual(default_setup['eigenmode']['basis_order'], '-1')
-
-        self.assertEqual(default_setup['q3d']['name'], 'Setup')
-        self.assertEqual(default_setup['q3d']['freq_ghz'], '5.0')
-        self.assertEqual(default_setup['q3d']['save_fields'], 'False')
-        self.assertEqual(default_setup['q3d']['enabled'], 'True')
-        self.assertEqual(default_setup['q3d']['max_passes'], '15')
-        self.assertEqual(default_setup['q3d']['min_passes'], '2')
-        self.assertEqual(default_setup['q3d']['min_converged_passes'], '2')
-        self.assertEqual(default_setup['q3d']['percent_error'], '0.5')
-        self.assertEqual(default_setup['q3d']['percent_refinement'], '30')
-        self.assertEqual(default_setup['q3d']['auto_increase_solution_order'],
-                         'True')
-        self.assertEqual(default_setup['q3d']['solution_order'], 'High')
-        self.assertEqual(default_setup['q3d']['solver_type'], 'Iterative')
+        self.assertEqual(QAnsysRenderer.default_setup,
+                         EXPECTED_ANSYS_DEFAULT_SETUP)
 
     def test_renderer_qq3d_render_options(self):
         """Test that defaults in QQ3DRenderer were not accidentally changed."""
-        design = designs.DesignPlanar()
-        renderer = QQ3DRenderer(design, initiate=False)
-        options = renderer.q3d_options
-
-        self.assertEqual(renderer.name, 'q3d')
-
-        self.assertEqual(len(options), 2)
-        self.assertEqual(options['material_type'], 'pec')
-        self.assertEqual(options['material_thickness'], '200nm')
+        self.assertEqual(self.q3d_renderer.name, 'q3d')
+        self.assertEqual(dict(self.q3d_options), EXPECTED_Q3D_OPTIONS)
 
     def test_renderer_hfss_render_options(self):
         """Test that defaults in QHFSSRender were not accidentally changed."""
-        design = designs.DesignPlanar()
-        renderer = QHFSSRenderer(design, initiate=False)
-        options = renderer.hfss_options
-
-        self.assertEqual(renderer.name, 'hfss')
-        self.assertEqual(len(options), 1)
-        self.assertEqual(options['port_inductor_gap'], '10um')
+        self.assertEqual(self.hfss_renderer.name, 'hfss')
+        self.assertEqual(dict(self.hfss_options), EXPECTED_HFSS_OPTIONS)
 
     def test_renderer_gdsrenderer_options(self):
         """Test that default_options in QGDSRenderer were not accidentally
         changed."""
-        design = designs.DesignPlanar()
-        renderer = QGDSRenderer(design)
-        options = renderer.default_options
-
-        self.assertEqual(len(options), 16)
-        self.assertEqual(options['short_segments_to_not_fillet'], 'True')
-        self.assertEqual(options['check_short_segments_by_scaling_fillet'],
-                         '2.0')
-        self.assertEqual(options['gds_unit'], '1')
-        self.assertEqual(options['ground_plane'], 'True')
-        self.assertEqual(options['negative_mask']['main'], [])
-        self.assertEqual(options['corners'], 'circular bend')
-        self.assertEqual(options['tolerance'], '0.00001')
-        self.assertEqual(options['precision'], '0.000000001')
-        self.assertEqual(options['width_LineString'], '10um')
-        self.assertEqual(options['path_filename'],
-                         '../resources/Fake_Junctions.GDS')
-        self.assertEqual(options['junction_pad_overlap'], '5um')
-        self.assertEqual(options['max_points'], '199')
-        self.assertEqual(options['bounding_box_scale_x'], '1.2')
-        self.assertEqual(options['bounding_box_scale_y'], '1.2')
-
-        self.assertEqual(len(options['cheese']), 9)
-        self.assertEqual(len(options['no_cheese']), 5)
-
-        self.assertEqual(options['cheese']['datatype'], '100')
-        self.assertEqual(options['cheese']['shape'], '0')
-        self.assertEqual(options['cheese']['cheese_0_x'], '25um')
-        self.assertEqual(options['cheese']['cheese_0_y'], '25um')
-        self.assertEqual(options['cheese']['cheese_1_radius'], '100um')
-        self.assertEqual(options['cheese']['delta_x'], '100um')
-        self.assertEqual(options['cheese']['delta_y'], '100um')
-        self.assertEqual(options['cheese']['edge_nocheese'], '200um')
-
-        self.assertEqual(options['no_cheese']['datatype'], '99')
-        self.assertEqual(options['no_cheese']['buffer'], '25um')
-        self.assertEqual(options['no_cheese']['cap_style'], '2')
-        self.assertEqual(options['no_cheese']['join_style'], '2')
-
-        self.assertEqual(len(options['cheese']['view_in_file']), 1)
-        self.assertEqual(len(options['cheese']['view_in_file']['main']), 1)
-        self.assertEqual(options['cheese']['view_in_file']['main'][1], True)
-
-        self.assertEqual(len(options['no_cheese']['view_in_file']), 1)
-        self.assertEqual(len(options['no_cheese']['view_in_file']['main']), 1)
-        self.assertEqual(options['no_cheese']['view_in_file']['main'][1], True)
+        self.assertEqual(dict(self.gds_options), EXPECTED_GDS_OPTIONS)
 
     def test_renderer_ansys_renderer_get_clean_name(self):
         """Test get_clean_name in ansys_renderer.py"""
         self.assertEqual(ansys_renderer.get_clean_name('name12'), 'name12')
         self.assertEqual(ansys_renderer.get_clean_name('12name12'), 'name12')
         self.assertEqual(ansys_renderer.get_clean_name('name!'), 'name')
+        self.assertEqual(ansys_renderer.get_clean_name('1!_name'), '_name')
+        self.assertEqual(ansys_renderer.get_clean_name('!2 na-me'), 'name')
 
     def test_renderer_ansys_renderer_name_delim(self):
         """Test NAME_DELIM in QAnsysRenderer."""
-        design = designs.DesignPlanar()
-        renderer = QAnsysRenderer(design, initiate=False)
+        renderer = self.ansys_renderer
         self.assertEqual(renderer.NAME_DELIM, '_')
 
     def test_renderer_ansys_renderer_name(self):
         """Test name in QAnsysRenderer."""
-        design = designs.DesignPlanar()
-        renderer = QAnsysRenderer(design, initiate=False)
+        renderer = self.ansys_renderer
         self.assertEqual(renderer.name, 'ansys')
 
+    def test_renderer_ansys_renderer_no_connection(self):
+        """Test that QAnsysRenderer warns and returns when not connected."""
+        renderer = self.ansys_renderer
+        self.assertIsNone(renderer.pinfo)
+
+        calls = [(renderer.activate_ansys_design, ('Design', 'eigenmode')),
+                 (renderer.activate_ansys_setup, ('Setup',))]
+        for method, args in calls:
+            with self.subTest(method=method.__name__):
+                with self.assertLogs(renderer.logger, 'WARNING') as logs:
+                    self.assertIsNone(method(*args))
+                self.assertIn('connect_ansys()', logs.output[0])
+
+    def test_renderer_ansys_renderer_no_project_or_design(self):
+        """Test that QAnsysRenderer warns and returns when no project or no
+        design is open in Ansys."""
+        renderer = QAnsysRenderer(self.design, initiate=False)
+        no_project = SimpleNamespace(project=None, design=None)
+        no_design = SimpleNamespace(project=SimpleNamespace(name='project'),
+                                    design=None)
+
+        cases = [
+            (no_project, renderer.activate_ansys_design,
+             ('Design', 'eigenmode'), 'Project not found'),
+            (no_project, renderer.activate_ansys_setup, ('Setup',),
+             'Project not found'),
+            (no_design, renderer.activate_ansys_setup, ('Setup',),
+             'Design not found'),
+        ]
+        for pinfo, method, args, expected in cases:
+            with self.subTest(method=method.__name__, expected=expected):
+                renderer._pinfo = pinfo
+                with self.assertLogs(renderer.logger, 'WARNING') as logs:
+                    self.assertIsNone(method(*args))
+                self.assertIn(expected, logs.output[0])
+
+        renderer._pinfo = no_design
+        with self.assertLogs(renderer.logger, 'WARNING') as logs:
+            self.assertIsNone(renderer._get_active_design('Nothing done.'))
+        self.assertTrue(logs.output[0].endswith('Nothing done.'))
+
+    def test_renderer_setup_editors_no_connection(self):
+        """Test that the HFSS and Q3D setup editors warn and return when not
+        connected to Ansys."""
+        hfss = self.hfss_renderer
+        q3d = self.q3d_renderer
+
+        calls = [(hfss.edit_eigenmode_setup, (dict(),), 'Setup not updated.'),
+                 (hfss.edit_drivenmodal_setup, (dict(),),
+                  'Setup not updated.'),
+                 (hfss.set_mode, (1, 'Setup'), 'The mode was not set.'),
+                 (q3d.edit_q3d_setup, (dict(),), 'Setup not updated.')]
+        for method, args, expected in calls:
+            with self.subTest(method=method.__qualname__):
+                self.assertIsNone(method.__self__.pinfo)
+                with self.assertLogs(method.__self__.logger, 'WARNING') as logs:
+                    self.assertIsNone(method(*args))
+                self.assertIn('connect_ansys()', logs.output[0])
+                self.assertTrue(logs.output[0].endswith(expected))
+
     def test_renderer_renderer_base_name(self):
         """Test name in QRenderer."""
         renderer = QRenderer
@@ -301,8 +328,7 @@ class TestRenderers(unittest.TestCase):
 
     def test_renderer_gdsrenderer_inclusive_bound(self):
         """Test functionality of inclusive_bound in gds_renderer.py."""
-        design = designs.DesignPlanar()
-        renderer = QGDSRenderer(design)
+        renderer = self.gds_renderer
 
         my_list = []
         my_list.append([1, 1, 2, 2])
@@ -312,8 +338,7 @@ class TestRenderers(unittest.TestCase):
 
     def test_renderer_scale_max_bounds(self):
         """Test functionality of scale_max_bounds in gds_renderer.py."""
-        design = designs.DesignPlanar()
-        renderer = QGDSRenderer(design)
+        renderer = self.gds_renderer
 
         actual = renderer._scale_max_bounds('main', [(1, 1, 3, 3)])
         self.assertEqual(len(actual), 2)
@@ -322,24 +347,14 @@ class TestRenderers(unittest.TestCase):
 
     def test_renderer_get_chip_names(self):
         """Test functionality of get_chip_names in gds_renderer.py."""
-        design = designs.DesignPlanar()
+        design = DesignPlanar()
         renderer = QGDSRenderer(design)
 
-        qgt = QGeometryTables(design)
-        qgt.clear_all_tables()
+        from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
 
-        transmon_pocket_1 = TransmonPocket(design, 'my_id')
-        transmon_pocket_1.make()
-        transmon_pocket_1.get_template_options(design)
-
-        a_linestring = draw.LineString([[0, 0], [0, 1]])
-        a_poly = draw.rectangle(2, 2, 0, 0)
-        qgt.add_qgeometry('path',
-                          'my_id', {'n_sprial': a_linestring},
-                          width=4000)
-        qgt.add_qgeometry('poly',
-                          'my_id', {'n_spira_etch': a_poly},
-                          subtract=True)
+        # Only the design's own tables are searched, and the component adds
+        # its qgeometry to them when it is created.
+        TransmonPocket(design, 'my_id')
 
         result = renderer._get_chip_names()
         self.assertEqual(result, {'main': {}})
@@ -358,8 +373,7 @@ class TestRenderers(unittest.TestCase):
 
     def test_renderer_ansys_renderer_element_table_data(self):
         """Test element_table_data in QAnsysRenderer."""
-        design = designs.DesignPlanar()
-        renderer = QAnsysRenderer(design, initiate=False)
+        renderer = self.ansys_renderer
         etd = renderer.element_table_data
 
         self.assertEqual(len(etd), 2)
@@ -375,8 +389,7 @@ class TestRenderers(unittest.TestCase):
     def test_renderer_gdsrenderer_high_level(self):
         """Test that high level defaults were not accidentally changed in
         gds_renderer.py."""
-        design = designs.DesignPlanar()
-        renderer = QGDSRenderer(design)
+        renderer = self.gds_renderer
 
         self.assertEqual(renderer.name, 'gds')
         element_table_data = renderer.element_table_data
@@ -387,7 +400,7 @@ class TestRenderers(unittest.TestCase):
 
     def test_renderer_gdsrenderer_update_units(self):
         """Test update_units in gds_renderer.py."""
-        design = designs.DesignPlanar()
+        design = DesignPlanar()
         renderer = QGDSRenderer(design)
 
         renderer.options['gds_unit'] = 12345
@@ -406,8 +419,7 @@ class TestRenderers(unittest.TestCase):
     # pylint: disable-msg=unused-variable
     def test_renderer_gdsrenderer_check_qcomps(self):
         """Test check_qcomps in gds_renderer.py."""
-        design = designs.DesignPlanar()
-        renderer = QGDSRenderer(design)
+        renderer = self.gds_renderer
 
         actual = []
         actual.append(renderer._check_qcomps([]))
@@ -429,36 +441,30 @@ class TestRenderers(unittest.TestCase):
 
     def test_renderer_mpl_interaction_disconnect(self):
         """Test disconnect in MplInteraction in mpl_interaction.py."""
+        import matplotlib.pyplot as _plt
         mpl = MplInteraction(_plt)
         mpl.disconnect()
         self.assertEqual(mpl.figure, None)
 
     def test_renderer_gds_check_cheese(self):
-        """Test check_cheese in gds_renderer.py."""
-        design = designs.DesignPlanar()
-        renderer = QGDSRenderer(design)
-
-        self.assertEqual(renderer._check_cheese('main', 0), 4)
-        self.assertEqual(renderer._check_cheese('main', 1), 1)
-        self.assertEqual(renderer._check_cheese('fake', 0), 3)
-
-    def test_renderer_gds_check_no_cheese(self):
-        """Test check_no_cheese in gds_renderer.py."""
-        design = designs.DesignPlanar()
-        renderer = QGDSRenderer(design)
-
-        self.assertEqual(renderer._check_no_cheese('main', 0), 4)
-        self.assertEqual(renderer._check_no_cheese('main', 1), 1)
-        self.assertEqual(renderer._check_no_cheese('fake', 0), 3)
-
-    def test_renderer_gds_check_either_cheese(self):
-        """Test check_either_cheese in gds_renderer.py."""
-        design = designs.DesignPlanar()
-        renderer = QGDSRenderer(design)
-
-        self.assertEqual(renderer._check_either_cheese('main', 0), 6)
-        self.assertEqual(renderer._check_either_cheese('main', 1), 1)
-        self.assertEqual(renderer._check_either_cheese('fake', 0), 5)
+        """Test check_cheese, check_no_cheese and check_either_cheese in
+        gds_renderer.py."""
+        renderer = self.gds_renderer
+
+        cases = [
+            (renderer._check_cheese, 'main', 0, 4),
+            (renderer._check_cheese, 'main', 1, 1),
+            (renderer._check_cheese, 'fake', 0, 3),
+            (renderer._check_no_cheese, 'main', 0, 4),
+            (renderer._check_no_cheese, 'main', 1, 1),
+            (renderer._check_no_cheese, 'fake', 0, 3),
+            (renderer._check_either_cheese, 'main', 0, 6),
+            (renderer._check_either_cheese, 'main', 1, 1),
+            (renderer._check_either_cheese, 'fake', 0, 5),
+        ]
+        for check, chip, layer, expected in cases:
+            with self.subTest(check=check.__name__, chip=chip, layer=layer):
+                self.assertEqual(check(chip, layer), expected)
 
 
 if __name__ == '__main__':
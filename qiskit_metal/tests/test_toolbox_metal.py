@@ -239,7 +239,7 @@ class TestToolboxMetal(unittest.TestCase, AssertionsMixin):
             'data_d': '2 mm'
         }
 
-        expected = [[2], [0.001], [20, 0.015, 6437376.0, 2]]
+        expected = [[2], [0.001], [20, 0.015, 6437376.0, 2], [0.015, 2]]
 
         actual = []
         actual.append(parsing.parse_options(dict_1, 'data_a'))
@@ -247,8 +247,9 @@ class TestToolboxMetal(unittest.TestCase, AssertionsMixin):
         actual.append(
             parsing.parse_options(dict_2, 'data_a,data_b,data_c,data_d',
                                   dict_1))
+        actual.append(parsing.parse_options(dict_2, ('data_b', 'data_d')))
 
-        for x in range(3):
+        for x in range(4):
             self.assertEqual(len(actual[x]), len(expected[x]))
             my_range = len(actual[x])
             for i in range(my_range):
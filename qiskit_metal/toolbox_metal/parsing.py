@@ -171,8 +171,9 @@ Returns:
 
 from collections.abc import Iterable
 from collections.abc import Mapping
+from functools import lru_cache
 from numbers import Number
-from typing import Union
+from typing import Sequence, Union
 
 import ast
 import numpy as np
@@ -245,8 +246,25 @@ def _parse_string_to_float(expr: str):
     Raises:
         Exception: Errors in parsing
     """
+    if isinstance(expr, str):
+        # The same few strings, such as '10um', are parsed for every
+        # rebuild of every component, so reuse the result.
+        return _convert_str_to_units(expr, units)
+    return _convert_to_units(expr, units)
+
+
+def _convert_to_units(expr, to_units: str):
+    """Convert expr to to_units, see _parse_string_to_float.
+
+    Args:
+        expr (str): Expression such as '1nm'.
+        to_units (str): Units to convert the value to, such as 'mm'.
+
+    Returns:
+        float: Converted value, or expr if it cannot be converted.
+    """
     try:
-        return UREG.Quantity(expr).to(units).magnitude
+        return UREG.Quantity(expr).to(to_units).magnitude
 
     except Exception:
         # DimensionalityError, UndefinedUnitError, TypeError
@@ -256,6 +274,10 @@ def _parse_string_to_float(expr: str):
             return expr
 
 
+# Results of _convert_to_units for str expressions, which are immutable.
+_convert_str_to_units = lru_cache(maxsize=4096)(_convert_to_units)
+
+
 #########################################################################
 # UNIT and Conversion related
 
@@ -412,14 +434,18 @@ def parse_value(value: str, variable_dict: dict):
     return value
 
 
-def parse_options(params: dict, parse_names: str, variable_dict=None):
+def parse_options(params: dict,
+                  parse_names: Union[str, Sequence[str]],
+                  variable_dict=None):
     """
     Calls parse_value to extract from a dictionary a small subset of values.
     You can specify parse_names = 'x,y,z,cpw_width'.
+    Callers in a loop can instead pass the names already split,
+    e.g., ('x', 'y', 'z', 'cpw_width'), to skip tokenizing the string.
 
     Args:
         params (dict): Dictionary of params
-        parse_names (str): Name to parse
+        parse_names (Union[str, Sequence[str]]): Names to parse
         variable_dict (dict): Dictionary of variables.  Defaults to None.
     """
 
@@ -427,10 +453,12 @@ def parse_options(params: dict, parse_names: str, variable_dict=None):
     if not variable_dict:  # If None, create an empty dict
         variable_dict = {}
 
+    if isinstance(parse_names, str):
+        # remove trailing and leading white spaces in the names
+        parse_names = [name.strip() for name in parse_names.split(',')]
+
     res = []
-    for name in parse_names.split(','):
-        name = name.strip(
-        )  # remove trailing and leading white spaces in the name
+    for name in parse_names:
 
         # is the name in the options at all?
         if not name in params: